@@ -3,11 +3,14 @@ NREL SLOPE Geospatial Dashboard
 Interactive dashboard for visualizing county energy data
 """
 
+import functools
+import importlib.util
 import dash
-from dash import dcc, html, Input, Output, callback
-import plotly.express as px
+from dash import dcc, html, dash_table, Input, Output, Patch, callback
 import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
+import numpy as np
 from pathlib import Path
 import sys
 import json
@@ -16,19 +19,31 @@ import json
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.data_storage import DataStorage
 
+# Gzip responses when flask-compress (dash[compress]) is installed
+COMPRESS = importlib.util.find_spec("flask_compress") is not None
+
+# Serialize figures and callback payloads with orjson when available
+if importlib.util.find_spec("orjson") is not None:
+    pio.json.config.default_engine = "orjson"
+
 
 class SLOPEDashboard:
     """Geospatial dashboard for NREL SLOPE county data"""
 
+    STATUS_COLORS = {'success': '#2ecc71', 'error': '#e74c3c'}
+    TABLE_COLUMNS = ['geoid', 'state_fips', 'county_fips', 'scrape_status', 'page_title']
+    CATEGORY_COLUMNS = ['state_fips', 'scrape_status']
+
     def __init__(self, data_file=None):
         """
         Initialize dashboard
 
         Args:
-            data_file (str): Path to data CSV file
+            data_file (str): Path to data CSV or Parquet file
         """
         self.storage = DataStorage()
-        self.app = dash.Dash(__name__, title="NREL SLOPE County Dashboard")
+        self.app = dash.Dash(__name__, title="NREL SLOPE County Dashboard",
+                             compress=COMPRESS)
 
         # Load data
         self.load_data(data_file)
@@ -40,38 +55,114 @@ class SLOPEDashboard:
     def load_data(self, data_file=None):
         """Load county data from storage"""
         if data_file:
-            self.df = pd.read_csv(data_file)
+            self.df = self.storage.load_shared_table(data_file)
         else:
-            # Try to load most recent processed data
-            processed_dir = Path("data/processed")
-            csv_files = sorted(processed_dir.glob("counties_data_*.csv"), reverse=True)
-
-            if csv_files:
-                self.df = pd.read_csv(csv_files[0])
-                print(f"Loaded data from: {csv_files[0]}")
+            # Try to load most recent processed data, preferring Parquet
+            processed_dir = self.storage.processed_dir
+            data_files = (sorted(processed_dir.glob("counties_data_*.parquet"), reverse=True) or
+                          sorted(processed_dir.glob("counties_data_*.csv"), reverse=True))
+
+            if data_files:
+                self.df = self.storage.load_shared_table(data_files[0])
+                print(f"Loaded data from: {data_files[0]}")
             else:
                 # Create sample data for demonstration
                 self.df = self.create_sample_data()
                 print("Using sample data")
 
+        # Low-cardinality columns become categoricals: small integer codes
+        # make filter comparisons and counts cheap
+        for col in self.CATEGORY_COLUMNS:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
+
+        # NumPy views of the filter codes, compared directly in callbacks
+        self._state_codes = self.df['state_fips'].cat.codes.to_numpy()
+        self._status_codes = self.df['scrape_status'].cat.codes.to_numpy()
+
+        # Filter combinations are finite; memoize their outputs per dataset
+        self.cached_outputs = functools.lru_cache(maxsize=256)(self.build_outputs)
+
     def create_sample_data(self):
         """Create sample data for demonstration"""
-        import numpy as np
-
-        # Create sample county data
+        # Create sample county data with whole-array string ops
         num_counties = 100
-        state_fips = [f"{i:02d}" for i in range(1, 51)]
+        idx = np.arange(num_counties).astype(str)
+        state_fips = np.char.zfill(np.arange(1, 51).astype(str), 2)
+        county_fips = np.char.zfill(idx, 5)
 
         data = {
-            'geoid': [f"G{np.random.choice(state_fips)}{i:05d}" for i in range(num_counties)],
+            'geoid': np.char.add(np.char.add('G', np.random.choice(state_fips, num_counties)),
+                                 county_fips),
             'state_fips': np.random.choice(state_fips, num_counties),
-            'county_fips': [f"{i:05d}" for i in range(num_counties)],
+            'county_fips': county_fips,
             'scrape_status': np.random.choice(['success', 'error'], num_counties, p=[0.9, 0.1]),
-            'page_title': [f"County {i}" for i in range(num_counties)],
+            'page_title': np.char.add('County ', idx),
         }
 
         return pd.DataFrame(data)
 
+    @staticmethod
+    def count_codes(codes, categories):
+        """Count rows per category from category codes in one bincount pass"""
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        present = np.flatnonzero(counts)
+        return categories.to_numpy()[present], counts[present]
+
+    @classmethod
+    def count_values(cls, column):
+        """Count distinct non-null values of a column (bincount over codes for categoricals)"""
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return cls.count_codes(column.cat.codes.to_numpy(), column.cat.categories)
+        values = column.to_numpy()
+        return np.unique(values[~pd.isna(values)], return_counts=True)
+
+    def category_code(self, column, value):
+        """Integer code of a value in a categorical column (-2, matching nothing, if absent)"""
+        categories = self.df[column].cat.categories
+        return categories.get_loc(value) if value in categories else -2
+
+    def status_colors(self, statuses):
+        """Map scrape statuses to their chart colors"""
+        return [self.STATUS_COLORS.get(status, '#95a5a6') for status in statuses]
+
+    def create_distribution_figure(self, df):
+        """Create the counties-by-state bar chart"""
+        states, counts = self.count_values(df['state_fips'])
+
+        fig = go.Figure(go.Bar(
+            x=states,
+            y=counts,
+            hovertemplate='State FIPS=%{x}<br>Number of Counties=%{y}<extra></extra>'
+        ))
+        fig.update_layout(
+            title='Counties by State FIPS',
+            xaxis_title='State FIPS',
+            yaxis_title='Number of Counties',
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Arial, sans-serif")
+        )
+        return fig
+
+    def create_status_figure(self, df):
+        """Create the scraping status pie chart"""
+        statuses, counts = self.count_values(df['scrape_status'])
+
+        fig = go.Figure(go.Pie(
+            labels=statuses,
+            values=counts,
+            marker=dict(colors=self.status_colors(statuses)),
+            hovertemplate='status=%{label}<br>count=%{value}<extra></extra>'
+        ))
+        fig.update_layout(
+            title='Scraping Status Distribution',
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Arial, sans-serif")
+        )
+        return fig
+
     def setup_layout(self):
         """Setup dashboard layout"""
         self.app.layout = html.Div([
@@ -121,7 +212,7 @@ class SLOPEDashboard:
                         id='state-filter',
                         options=[{'label': 'All States', 'value': 'all'}] +
                                 [{'label': f"State {s}", 'value': s}
-                                 for s in sorted(self.df['state_fips'].unique())],
+                                 for s in self.df['state_fips'].cat.categories],
                         value='all',
                         style={'width': '100%'}
                     ),
@@ -147,19 +238,30 @@ class SLOPEDashboard:
             html.Div([
                 # Distribution Chart
                 html.Div([
-                    dcc.Graph(id='distribution-chart'),
+                    dcc.Graph(id='distribution-chart',
+                              figure=self.create_distribution_figure(self.df)),
                 ], style={'width': '48%', 'display': 'inline-block', 'margin': '1%'}),
 
                 # Status Chart
                 html.Div([
-                    dcc.Graph(id='status-chart'),
+                    dcc.Graph(id='status-chart',
+                              figure=self.create_status_figure(self.df)),
                 ], style={'width': '48%', 'display': 'inline-block', 'margin': '1%'}),
             ]),
 
             # Data Table
             html.Div([
                 html.H3("County Data", style={'color': '#2c3e50'}),
-                html.Div(id='data-table'),
+                dash_table.DataTable(
+                    id='data-table',
+                    columns=[{'name': col, 'id': col} for col in self.TABLE_COLUMNS],
+                    data=self.cached_outputs('all', 'all')[2],
+                    style_header={'padding': '10px', 'backgroundColor': '#3498db',
+                                  'color': 'white', 'textAlign': 'left'},
+                    style_cell={'padding': '10px', 'textAlign': 'left',
+                                'fontFamily': 'Arial, sans-serif'},
+                    style_data={'borderBottom': '1px solid #ddd'},
+                ),
             ], style={'padding': '20px', 'backgroundColor': 'white', 'margin': '20px',
                      'borderRadius': '8px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}),
 
@@ -173,86 +275,70 @@ class SLOPEDashboard:
 
         ], style={'fontFamily': 'Arial, sans-serif', 'backgroundColor': '#f5f6fa'})
 
+    def build_outputs(self, state_value, status_value):
+        """
+        Build the chart patches and table rows for one filter combination
+
+        Args:
+            state_value (str): Selected state FIPS or 'all'
+            status_value (str): Selected scrape status or 'all'
+
+        Returns:
+            tuple: (distribution patch, status patch, table records)
+        """
+        # Select rows with one combined mask over the category codes
+        mask = np.ones(len(self.df), dtype=bool)
+        if state_value != 'all':
+            mask &= self._state_codes == self.category_code('state_fips', state_value)
+        if status_value != 'all':
+            mask &= self._status_codes == self.category_code('scrape_status', status_value)
+        rows = np.flatnonzero(mask)
+
+        # Figures are sent whole with the layout; callbacks only patch
+        # the trace data so layout JSON is not re-serialized each time.
+        # Counts come straight from the selected codes, so no filtered
+        # frame is built, and plain lists keep cached patches cheap to encode.
+        states, state_counts = self.count_codes(self._state_codes[rows],
+                                                self.df['state_fips'].cat.categories)
+        dist_fig = Patch()
+        dist_fig['data'][0]['x'] = states.tolist()
+        dist_fig['data'][0]['y'] = state_counts.tolist()
+
+        statuses, status_counts = self.count_codes(self._status_codes[rows],
+                                                   self.df['scrape_status'].cat.categories)
+        status_fig = Patch()
+        status_fig['data'][0]['labels'] = statuses.tolist()
+        status_fig['data'][0]['values'] = status_counts.tolist()
+        status_fig['data'][0]['marker']['colors'] = self.status_colors(statuses)
+
+        # Data table: only the first 20 matching rows are materialized
+        table = self.df.iloc[rows[:20]][self.TABLE_COLUMNS].to_dict('records')
+
+        return dist_fig, status_fig, table
+
     def setup_callbacks(self):
         """Setup dashboard callbacks"""
 
         @self.app.callback(
             [Output('distribution-chart', 'figure'),
              Output('status-chart', 'figure'),
-             Output('data-table', 'children')],
+             Output('data-table', 'data')],
             [Input('state-filter', 'value'),
-             Input('status-filter', 'value')]
+             Input('status-filter', 'value')],
+            # The layout already renders the unfiltered view
+            prevent_initial_call=True
         )
         def update_dashboard(state_value, status_value):
-            # Filter data
-            filtered_df = self.df.copy()
-
-            if state_value != 'all':
-                filtered_df = filtered_df[filtered_df['state_fips'] == state_value]
-
-            if status_value != 'all':
-                filtered_df = filtered_df[filtered_df['scrape_status'] == status_value]
-
-            # Distribution chart
-            state_counts = filtered_df['state_fips'].value_counts().reset_index()
-            state_counts.columns = ['state_fips', 'count']
-
-            dist_fig = px.bar(
-                state_counts,
-                x='state_fips',
-                y='count',
-                title='Counties by State FIPS',
-                labels={'state_fips': 'State FIPS', 'count': 'Number of Counties'}
-            )
-            dist_fig.update_layout(
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Arial, sans-serif")
-            )
-
-            # Status chart
-            status_counts = filtered_df['scrape_status'].value_counts().reset_index()
-            status_counts.columns = ['status', 'count']
-
-            status_fig = px.pie(
-                status_counts,
-                values='count',
-                names='status',
-                title='Scraping Status Distribution',
-                color='status',
-                color_discrete_map={'success': '#2ecc71', 'error': '#e74c3c'}
-            )
-            status_fig.update_layout(
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Arial, sans-serif")
-            )
-
-            # Data table
-            table_data = filtered_df[['geoid', 'state_fips', 'county_fips',
-                                      'scrape_status', 'page_title']].head(20)
-
-            table = html.Table([
-                html.Thead(
-                    html.Tr([html.Th(col, style={'padding': '10px', 'backgroundColor': '#3498db',
-                                                 'color': 'white', 'textAlign': 'left'})
-                            for col in table_data.columns])
-                ),
-                html.Tbody([
-                    html.Tr([
-                        html.Td(table_data.iloc[i][col],
-                               style={'padding': '10px', 'borderBottom': '1px solid #ddd'})
-                        for col in table_data.columns
-                    ]) for i in range(len(table_data))
-                ])
-            ], style={'width': '100%', 'borderCollapse': 'collapse'})
-
-            return dist_fig, status_fig, table
-
-    def run(self, debug=True, port=8050):
+            return self.cached_outputs(state_value, status_value)
+
+    def run(self, debug=False, port=8050):
         """
         Run the dashboard server
 
+        Dev tools (hot reload, prop checks) are only enabled in debug mode.
+        For production, serve ``self.app.server`` with a WSGI server such
+        as gunicorn instead of the Flask development server.
+
         Args:
             debug (bool): Run in debug mode
             port (int): Port number
@@ -264,7 +350,8 @@ class SLOPEDashboard:
         print(f"Data loaded: {len(self.df)} counties")
         print(f"{'='*60}\n")
 
-        self.app.run_server(debug=debug, port=port, host='0.0.0.0')
+        self.app.run_server(debug=debug, dev_tools_hot_reload=debug,
+                            dev_tools_props_check=debug, port=port, host='0.0.0.0')
 
 
 def main():
@@ -274,7 +361,7 @@ def main():
     parser = argparse.ArgumentParser(description="NREL SLOPE Geospatial Dashboard")
     parser.add_argument(
         "--data",
-        help="Path to data CSV file"
+        help="Path to data CSV or Parquet file"
     )
     parser.add_argument(
         "--port",
@@ -282,16 +369,21 @@ def main():
         default=8050,
         help="Port number (default: 8050)"
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug mode with hot reload (default: off)"
+    )
     parser.add_argument(
         "--no-debug",
         action="store_true",
-        help="Disable debug mode"
+        help=argparse.SUPPRESS  # Kept for old scripts; debug is off by default
     )
 
     args = parser.parse_args()
 
     dashboard = SLOPEDashboard(data_file=args.data)
-    dashboard.run(debug=not args.no_debug, port=args.port)
+    dashboard.run(debug=args.debug and not args.no_debug, port=args.port)
 
 
 if __name__ == "__main__":
@@ -4,14 +4,24 @@ Shows county data on hover, zooms on search
 """
 
 import dash
-from dash import dcc, html, Input, Output, State, callback
+from dash import dcc, html, Input, Output, State, Patch, callback
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 import json
+import importlib.util
 from pathlib import Path
 import numpy as np
 
+# Parse data and serialize figures/callback payloads with orjson when available
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+    json_loads = orjson.loads
+    pio.json.config.default_engine = "orjson"
+else:
+    json_loads = json.loads
+
 # Initialize app
 app = dash.Dash(__name__, title="NREL SLOPE Interactive Map")
 server = app.server
@@ -22,8 +32,7 @@ def load_data():
     data_path = Path(__file__).parent / "data" / "dashboard_data.json"
 
     if data_path.exists():
-        with open(data_path, 'r') as f:
-            data = json.load(f)
+        data = json_loads(data_path.read_bytes())
         df = pd.DataFrame(data)
     else:
         # Sample data
@@ -35,6 +44,11 @@ def load_data():
     if 'lon' not in df.columns:
         df['lon'] = np.random.uniform(-125, -65, len(df))
 
+    # Low-cardinality columns become categoricals (small integer codes)
+    for col in ('state', 'scrape_status'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
     return df
 
 def create_sample_data():
@@ -44,10 +58,11 @@ def create_sample_data():
     # Sample US county coordinates
     lats = np.random.uniform(25, 50, num_counties)
     lons = np.random.uniform(-125, -65, num_counties)
+    idx = np.arange(num_counties).astype(str)
 
     data = {
-        'geoid': [f"G{i:07d}" for i in range(num_counties)],
-        'county_name': [f"County {i}" for i in range(num_counties)],
+        'geoid': np.char.add('G', np.char.zfill(idx, 7)),
+        'county_name': np.char.add('County ', idx),
         'state': np.random.choice(['AL', 'CA', 'TX', 'NY', 'FL'], num_counties),
         'population': np.random.randint(10000, 1000000, num_counties),
         'solar_potential_mw': np.random.randint(100, 5000, num_counties),
@@ -60,36 +75,145 @@ def create_sample_data():
 
     return pd.DataFrame(data)
 
+def _text_column(df, column, default, fmt=None):
+    """Stringify a whole column at once, falling back to a constant if missing"""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index)
+    if fmt:
+        return df[column].map(fmt.format)
+    return df[column].astype(str)
+
+# Hover template, filled per county from pre-stringified columns
+HOVER_TEMPLATE = (
+    "<b>{}</b><br>\n"
+    "State: {}<br>\n"
+    "GeoID: {}<br>\n"
+    "Population: {}<br>\n"
+    "Solar Potential: {} MW<br>\n"
+    "Wind Potential: {} MW<br>\n"
+    "Energy Burden: {}%<br>\n"
+    "Status: {}"
+)
+
+def build_hover_text(df):
+    """Build hover text for every county from pre-stringified columns"""
+    columns = [
+        _text_column(df, 'county_name', 'Unknown County'),
+        _text_column(df, 'state', 'N/A'),
+        _text_column(df, 'geoid', 'N/A'),
+        _text_column(df, 'population', 'N/A', '{:,}'),
+        _text_column(df, 'solar_potential_mw', '0', '{:.0f}'),
+        _text_column(df, 'wind_potential_mw', '0', '{:.0f}'),
+        _text_column(df, 'energy_burden_pct', '0.0', '{:.1f}'),
+        _text_column(df, 'scrape_status', 'Unknown'),
+    ]
+    # One format call per row over the zipped columns (the pl.format shape);
+    # avoids allocating an intermediate Series for every concatenation
+    rows = zip(*(column.to_numpy() for column in columns))
+    return pd.Series([HOVER_TEMPLATE.format(*row) for row in rows], index=df.index, dtype=object)
+
 # Load data
 df = load_data()
 
+# Precompute hover text and per-state lookups once so callbacks only slice
+df['hover_text'] = build_hover_text(df)
+
+_state_codes = df['state'].cat.codes.to_numpy()
+STATE_INDEX = {state: np.flatnonzero(_state_codes == code)
+               for code, state in enumerate(df['state'].cat.categories)}
+STATE_COUNT = {state: len(rows) for state, rows in STATE_INDEX.items()}
+_state_totals = df.groupby('state', observed=True)[['solar_potential_mw', 'wind_potential_mw']].sum()
+STATE_SOLAR_SUM = _state_totals['solar_potential_mw'].to_dict()
+STATE_WIND_SUM = _state_totals['wind_potential_mw'].to_dict()
+
+# 'all' is just another key so the callback never branches on totals
+STATE_COUNT['all'] = len(df)
+STATE_SOLAR_SUM['all'] = df['solar_potential_mw'].sum()
+STATE_WIND_SUM['all'] = df['wind_potential_mw'].sum()
+
+# Lowercase search columns, prebuilt as fixed-width string arrays
+COUNTY_NAME_LC = df['county_name'].fillna('').str.lower().to_numpy(dtype=str)
+GEOID_LC = df['geoid'].fillna('').str.lower().to_numpy(dtype=str)
+
+# Zoomed-out views with more markers than this are binned server-side
+MAX_MARKERS = 5000
+BIN_DEGREES = 0.5
+DETAIL_ZOOM = 5
+
+def bin_markers(df_filtered, bin_degrees=BIN_DEGREES):
+    """
+    Aggregate markers onto a lat/lon grid, one marker per occupied cell
+
+    Each cell sits at the mean position of its counties and is colored by
+    their mean solar potential, so the payload scales with the grid size
+    rather than the number of rows.
+    """
+    lat = df_filtered['lat'].to_numpy(dtype=float)
+    lon = df_filtered['lon'].to_numpy(dtype=float)
+    if 'solar_potential_mw' in df_filtered.columns:
+        solar = df_filtered['solar_potential_mw'].to_numpy(dtype=float)
+    else:
+        solar = np.zeros(len(df_filtered))
+
+    valid = ~(np.isnan(lat) | np.isnan(lon))
+    lat, lon, solar = lat[valid], lon[valid], solar[valid]
+
+    cells = np.stack([np.floor(lat / bin_degrees), np.floor(lon / bin_degrees)], axis=1)
+    _, cell_idx, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+    cell_idx = cell_idx.ravel()
+
+    def cell_mean(values):
+        return np.bincount(cell_idx, weights=values) / counts
+
+    cell_solar = cell_mean(solar)
+    text = ('<b>' + pd.Series(counts).astype(str) + ' counties</b><br>\n'
+            'Avg Solar Potential: ' + pd.Series(cell_solar).map('{:.0f}'.format) + ' MW')
+
+    return dict(
+        lon=cell_mean(lon).astype(np.float32),
+        lat=cell_mean(lat).astype(np.float32),
+        text=text.to_numpy(),
+        color=cell_solar.astype(np.float32)
+    )
+
+def marker_data(df_filtered, zoom_level=3):
+    """Marker arrays for the map trace: one per county, or grid bins when zoomed out"""
+    if zoom_level <= DETAIL_ZOOM and len(df_filtered) > MAX_MARKERS:
+        return bin_markers(df_filtered)
+
+    # Hover text is precomputed at load; build it only for foreign frames
+    if 'hover_text' in df_filtered.columns:
+        hover_text = df_filtered['hover_text']
+    else:
+        hover_text = build_hover_text(df_filtered)
+
+    # float32 is ample for coordinates and a color scale, and orjson writes
+    # its shortest repr, roughly halving the marker payload
+    return dict(
+        lon=df_filtered['lon'].to_numpy(dtype=np.float32),
+        lat=df_filtered['lat'].to_numpy(dtype=np.float32),
+        text=hover_text.to_numpy(),
+        color=df_filtered['solar_potential_mw'].to_numpy(dtype=np.float32)
+        if 'solar_potential_mw' in df_filtered.columns else 0
+    )
+
 # Create map figure
 def create_map(df_filtered, zoom_lat=None, zoom_lon=None, zoom_level=3):
     """Create interactive map"""
 
-    # Create hover text
-    df_filtered['hover_text'] = df_filtered.apply(lambda row: f"""
-<b>{row.get('county_name', 'Unknown County')}</b><br>
-State: {row.get('state', 'N/A')}<br>
-GeoID: {row.get('geoid', 'N/A')}<br>
-Population: {row.get('population', 'N/A'):,}<br>
-Solar Potential: {row.get('solar_potential_mw', 0):.0f} MW<br>
-Wind Potential: {row.get('wind_potential_mw', 0):.0f} MW<br>
-Energy Burden: {row.get('energy_burden_pct', 0):.1f}%<br>
-Status: {row.get('scrape_status', 'Unknown')}
-    """.strip(), axis=1)
+    markers = marker_data(df_filtered, zoom_level)
 
     fig = go.Figure()
 
     # Add county markers
     fig.add_trace(go.Scattergeo(
-        lon=df_filtered['lon'],
-        lat=df_filtered['lat'],
-        text=df_filtered['hover_text'],
+        lon=markers['lon'],
+        lat=markers['lat'],
+        text=markers['text'],
         mode='markers',
         marker=dict(
             size=8,
-            color=df_filtered.get('solar_potential_mw', 0),
+            color=markers['color'],
             colorscale='Viridis',
             showscale=True,
             colorbar=dict(title="Solar Potential (MW)"),
@@ -152,7 +276,7 @@ app.layout = html.Div([
                 id='state-filter',
                 options=[{'label': 'All States', 'value': 'all'}] +
                         [{'label': state, 'value': state}
-                         for state in sorted(df['state'].unique())],
+                         for state in df['state'].cat.categories],
                 value='all',
                 style={'width': '100%', 'marginTop': '5px'}
             ),
@@ -183,14 +307,14 @@ app.layout = html.Div([
                  'borderRadius': '8px'}),
 
         html.Div([
-            html.H3(id='stat-solar', children=f"{df['solar_potential_mw'].sum():,.0f}"),
+            html.H3(id='stat-solar', children=f"{STATE_SOLAR_SUM['all']:,.0f}"),
             html.P("Total Solar Potential (MW)"),
         ], style={'flex': 1, 'textAlign': 'center', 'padding': '20px',
                  'backgroundColor': '#2ecc71', 'color': 'white', 'margin': '10px',
                  'borderRadius': '8px'}),
 
         html.Div([
-            html.H3(id='stat-wind', children=f"{df['wind_potential_mw'].sum():,.0f}"),
+            html.H3(id='stat-wind', children=f"{STATE_WIND_SUM['all']:,.0f}"),
             html.P("Total Wind Potential (MW)"),
         ], style={'flex': 1, 'textAlign': 'center', 'padding': '20px',
                  'backgroundColor': '#e74c3c', 'color': 'white', 'margin': '10px',
@@ -220,31 +344,35 @@ app.layout = html.Div([
      Output('county-detail', 'children')],
     [Input('search-button', 'n_clicks'),
      Input('state-filter', 'value')],
-    [State('search-input', 'value')]
+    [State('search-input', 'value')],
+    # The layout already renders the unfiltered map and totals
+    prevent_initial_call=True
 )
 def update_map(n_clicks, state_filter, search_query):
     """Update map based on filters and search"""
 
-    # Filter by state
-    df_filtered = df.copy()
-    if state_filter != 'all':
-        df_filtered = df_filtered[df_filtered['state'] == state_filter]
+    # Filter by state (positional slice of the shared frame, no copy)
+    if state_filter == 'all':
+        rows = None
+        df_filtered = df
+    else:
+        rows = STATE_INDEX.get(state_filter, np.empty(0, dtype=np.intp))
+        df_filtered = df.iloc[rows]
 
     # Search and zoom
     zoom_lat, zoom_lon, zoom_level = None, None, 3
     county_detail = html.P("Select a county to see details", style={'color': '#7f8c8d'})
 
     if search_query and n_clicks > 0:
-        # Search in county name or geoid
-        search_mask = (
-            df_filtered['county_name'].str.contains(search_query, case=False, na=False) |
-            df_filtered['geoid'].str.contains(search_query, case=False, na=False)
-        )
-        search_results = df_filtered[search_mask]
-
-        if len(search_results) > 0:
+        # Search in county name or geoid (literal, case-insensitive substring)
+        query = search_query.lower()
+        names = COUNTY_NAME_LC if rows is None else COUNTY_NAME_LC[rows]
+        geoids = GEOID_LC if rows is None else GEOID_LC[rows]
+        search_mask = (np.char.find(names, query) >= 0) | (np.char.find(geoids, query) >= 0)
+
+        if search_mask.any():
             # Zoom to first result
-            first_result = search_results.iloc[0]
+            first_result = df_filtered.iloc[np.argmax(search_mask)]
             zoom_lat = first_result['lat']
             zoom_lon = first_result['lon']
             zoom_level = 10  # Closer zoom
@@ -263,13 +391,24 @@ def update_map(n_clicks, state_filter, search_query):
                       style={'marginBottom': '5px'}),
             ])
 
-    # Create map
-    fig = create_map(df_filtered, zoom_lat, zoom_lon, zoom_level)
+    # Patch the map in place: only marker data and the geo view change,
+    # so the basemap layout is not re-serialized on every callback
+    markers = marker_data(df_filtered, zoom_level)
+    fig = Patch()
+    fig['data'][0]['lon'] = markers['lon']
+    fig['data'][0]['lat'] = markers['lat']
+    fig['data'][0]['text'] = markers['text']
+    fig['data'][0]['marker']['color'] = markers['color']
+    fig['layout']['geo']['center'] = dict(
+        lat=zoom_lat if zoom_lat else df_filtered['lat'].mean(),
+        lon=zoom_lon if zoom_lon else df_filtered['lon'].mean()
+    )
+    fig['layout']['geo']['projection']['scale'] = zoom_level
 
-    # Update stats
-    total_counties = len(df_filtered)
-    total_solar = f"{df_filtered['solar_potential_mw'].sum():,.0f} MW"
-    total_wind = f"{df_filtered['wind_potential_mw'].sum():,.0f} MW"
+    # Update stats from the precomputed per-state totals
+    total_counties = STATE_COUNT.get(state_filter, 0)
+    total_solar = f"{STATE_SOLAR_SUM.get(state_filter, 0):,.0f} MW"
+    total_wind = f"{STATE_WIND_SUM.get(state_filter, 0):,.0f} MW"
 
     return fig, total_counties, total_solar, total_wind, county_detail
 
@@ -4,13 +4,31 @@ This version uses pre-scraped static data for deployment
 """
 
 import dash
-from dash import dcc, html, Input, Output
-import plotly.express as px
+from dash import dcc, html, dash_table, Input, Output, Patch
+import plotly.graph_objects as go
+import plotly.io as pio
 import pandas as pd
+import functools
+import gzip
+import importlib.util
 import json
 import os
 from pathlib import Path
 
+# Parquet data is only read when pyarrow is installed
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Parse data files and serialize figures with orjson when available
+try:
+    import orjson
+    json_loads = orjson.loads
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    json_loads = json.loads
+
+# Columns the dashboard actually displays; everything else is dropped on load
+TABLE_COLUMNS = ['geoid', 'state_fips', 'county_fips', 'scrape_status', 'page_title']
+
 # Initialize Dash app
 app = dash.Dash(
     __name__,
@@ -20,6 +38,13 @@ app = dash.Dash(
 server = app.server  # For Vercel deployment
 
 # Load data function
+def read_data_file(data_path):
+    """Read a data file, preferring the precompressed copy beside it"""
+    gz_path = data_path.with_name(data_path.name + '.gz')
+    if gz_path.exists():
+        return gzip.decompress(gz_path.read_bytes())
+    return data_path.read_bytes()
+
 def load_dashboard_data():
     """Load data from static file or use sample data"""
 
@@ -31,42 +56,148 @@ def load_dashboard_data():
         Path("dashboard_data.json")
     ]
 
+    df = None
     for data_path in possible_paths:
-        if data_path.exists():
+        parquet_path = data_path.with_suffix('.parquet')
+        if HAS_PYARROW and parquet_path.exists():
             try:
-                with open(data_path, 'r') as f:
-                    data = json.load(f)
+                # Columnar read; columns the dashboard never shows are skipped
+                df = pd.read_parquet(parquet_path, engine='pyarrow', columns=TABLE_COLUMNS)
+                print(f"✓ Loaded data from: {parquet_path}")
+                break
+            except Exception as e:
+                print(f"Error loading {parquet_path}: {e}")
+
+        if data_path.exists() or data_path.with_name(data_path.name + '.gz').exists():
+            try:
+                data = json_loads(read_data_file(data_path))
                 df = pd.DataFrame(data)
+                df = df[[col for col in TABLE_COLUMNS if col in df.columns]]
                 print(f"✓ Loaded data from: {data_path}")
-                return df
+                break
             except Exception as e:
                 print(f"Error loading {data_path}: {e}")
                 continue
 
-    # If no data file found, use sample data
-    print("⚠️ No data file found, using sample data")
-    return create_sample_data()
+    if df is None:
+        # If no data file found, use sample data
+        print("⚠️ No data file found, using sample data")
+        df = create_sample_data()
+
+    # Low-cardinality columns become categoricals (small integer codes)
+    for col in ('state_fips', 'scrape_status'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    return df
 
 def create_sample_data():
     """Create sample data for demonstration"""
     import numpy as np
 
     num_counties = 100
-    state_fips = [f"{i:02d}" for i in range(1, 51)]
+    state_fips = np.char.zfill(np.arange(1, 51).astype(str), 2)
+    county_fips = np.char.zfill(np.arange(num_counties).astype(str), 5)
+
+    # Draw states once so each geoid agrees with its state_fips column
+    state_fips_arr = np.random.choice(state_fips, num_counties)
 
     data = {
-        'geoid': [f"G{np.random.choice(state_fips)}{i:05d}" for i in range(num_counties)],
-        'state_fips': np.random.choice(state_fips, num_counties),
-        'county_fips': [f"{i:05d}" for i in range(num_counties)],
+        'geoid': np.char.add(np.char.add('G', state_fips_arr), county_fips),
+        'state_fips': state_fips_arr,
+        'county_fips': county_fips,
         'scrape_status': np.random.choice(['success', 'error'], num_counties, p=[0.9, 0.1]),
-        'page_title': [f"County {i}" for i in range(num_counties)],
+        'page_title': np.char.add('County ', np.arange(num_counties).astype(str)),
     }
 
     return pd.DataFrame(data)
 
+STATUS_COLORS = {'success': '#2ecc71', 'error': '#e74c3c'}
+
+def status_colors(statuses):
+    """Map status labels to pie slice colors"""
+    return [STATUS_COLORS.get(status, '#95a5a6') for status in statuses]
+
+def create_distribution_figure(state_counts):
+    """Create the counties-by-state bar chart"""
+    fig = go.Figure(go.Bar(
+        x=state_counts.index.to_numpy(),
+        y=state_counts.to_numpy(),
+        hovertemplate='State FIPS=%{x}<br>Number of Counties=%{y}<extra></extra>'
+    ))
+    fig.update_layout(
+        title='Counties by State FIPS',
+        xaxis_title='State FIPS',
+        yaxis_title='Number of Counties',
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial, sans-serif")
+    )
+    return fig
+
+def create_status_figure(status_counts):
+    """Create the scraping status pie chart"""
+    fig = go.Figure(go.Pie(
+        labels=status_counts.index.to_numpy(),
+        values=status_counts.to_numpy(),
+        marker=dict(colors=status_colors(status_counts.index)),
+        hovertemplate='status=%{label}<br>count=%{value}<extra></extra>'
+    ))
+    fig.update_layout(
+        title='Scraping Status Distribution',
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial, sans-serif")
+    )
+    return fig
+
 # Load data
 df = load_dashboard_data()
 
+# Pre-computed aggregations
+STATUS_VALUES = ['all', 'success', 'error']
+STATE_VALUES = list(df['state_fips'].cat.categories)
+
+TOTAL_COUNTIES = len(df)
+SUCCESS_COUNT = int((df['scrape_status'] == 'success').sum())
+STATE_COUNT = df['state_fips'].nunique()
+STATE_OPTIONS = [{'label': 'All States', 'value': 'all'}] + [
+    {'label': f"State {s}", 'value': s} for s in STATE_VALUES
+]
+
+def filter_data(state_value, status_value):
+    """Return the rows matching the state and status filters"""
+    mask = pd.Series(True, index=df.index)
+
+    if state_value != 'all':
+        mask &= df['state_fips'] == state_value
+
+    if status_value != 'all':
+        mask &= df['scrape_status'] == status_value
+
+    return df[mask]
+
+def observed_counts(column):
+    """value_counts without the zero rows categoricals keep for absent values"""
+    counts = column.value_counts()
+    return counts[counts > 0]
+
+def summarize(filtered_df):
+    """Aggregate one filtered view into chart counts and table rows"""
+    return (
+        observed_counts(filtered_df['state_fips']),
+        observed_counts(filtered_df['scrape_status']),
+        filtered_df[TABLE_COLUMNS].head(20).to_dict('records'),
+    )
+
+# Only a few hundred (state, status) combinations exist, so every
+# dropdown selection is aggregated once here instead of per callback
+PRECOMP = {
+    (state, status): summarize(filter_data(state, status))
+    for state in ['all'] + STATE_VALUES
+    for status in STATUS_VALUES
+}
+
 # Dashboard Layout
 app.layout = html.Div([
     # Header
@@ -81,7 +212,7 @@ app.layout = html.Div([
     html.Div([
         html.Div([
             html.Div([
-                html.H3(str(len(df)), style={'margin': 0, 'color': '#3498db'}),
+                html.H3(str(TOTAL_COUNTIES), style={'margin': 0, 'color': '#3498db'}),
                 html.P("Total Counties", style={'margin': 0, 'color': '#7f8c8d'}),
             ], style={'textAlign': 'center', 'padding': '20px', 'backgroundColor': 'white',
                      'borderRadius': '8px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}),
@@ -89,7 +220,7 @@ app.layout = html.Div([
 
         html.Div([
             html.Div([
-                html.H3(str(len(df[df['scrape_status'] == 'success'])),
+                html.H3(str(SUCCESS_COUNT),
                        style={'margin': 0, 'color': '#2ecc71'}),
                 html.P("Successful Scrapes", style={'margin': 0, 'color': '#7f8c8d'}),
             ], style={'textAlign': 'center', 'padding': '20px', 'backgroundColor': 'white',
@@ -98,7 +229,7 @@ app.layout = html.Div([
 
         html.Div([
             html.Div([
-                html.H3(str(df['state_fips'].nunique()),
+                html.H3(str(STATE_COUNT),
                        style={'margin': 0, 'color': '#e74c3c'}),
                 html.P("States Covered", style={'margin': 0, 'color': '#7f8c8d'}),
             ], style={'textAlign': 'center', 'padding': '20px', 'backgroundColor': 'white',
@@ -113,9 +244,7 @@ app.layout = html.Div([
             html.Label("Filter by State FIPS:", style={'fontWeight': 'bold'}),
             dcc.Dropdown(
                 id='state-filter',
-                options=[{'label': 'All States', 'value': 'all'}] +
-                        [{'label': f"State {s}", 'value': s}
-                         for s in sorted(df['state_fips'].unique())],
+                options=STATE_OPTIONS,
                 value='all',
                 style={'width': '100%'}
             ),
@@ -141,19 +270,30 @@ app.layout = html.Div([
     html.Div([
         # Distribution Chart
         html.Div([
-            dcc.Graph(id='distribution-chart'),
+            dcc.Graph(id='distribution-chart',
+                      figure=create_distribution_figure(PRECOMP[('all', 'all')][0])),
         ], style={'width': '48%', 'display': 'inline-block', 'margin': '1%'}),
 
         # Status Chart
         html.Div([
-            dcc.Graph(id='status-chart'),
+            dcc.Graph(id='status-chart',
+                      figure=create_status_figure(PRECOMP[('all', 'all')][1])),
         ], style={'width': '48%', 'display': 'inline-block', 'margin': '1%'}),
     ]),
 
     # Data Table
     html.Div([
         html.H3("County Data Sample", style={'color': '#2c3e50'}),
-        html.Div(id='data-table'),
+        dash_table.DataTable(
+            id='data-table',
+            columns=[{'name': col, 'id': col} for col in TABLE_COLUMNS],
+            data=PRECOMP[('all', 'all')][2],
+            style_header={'padding': '10px', 'backgroundColor': '#3498db',
+                          'color': 'white', 'textAlign': 'left'},
+            style_cell={'padding': '10px', 'textAlign': 'left',
+                        'fontFamily': 'Arial, sans-serif'},
+            style_data={'borderBottom': '1px solid #ddd'},
+        ),
     ], style={'padding': '20px', 'backgroundColor': 'white', 'margin': '20px',
              'borderRadius': '8px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}),
 
@@ -167,79 +307,39 @@ app.layout = html.Div([
 
 ], style={'fontFamily': 'Arial, sans-serif', 'backgroundColor': '#f5f6fa'})
 
+# Each combination's patches are built once and replayed on repeat clicks
+@functools.lru_cache(maxsize=256)
+def build_outputs(state_value, status_value):
+    """Build the chart patches and table rows for one filter combination"""
+    # Cleared dropdowns fall outside the pre-computed keys
+    precomp = PRECOMP.get((state_value, status_value))
+    if precomp is None:
+        precomp = summarize(filter_data(state_value, status_value))
+    state_counts, status_counts, table_data = precomp
+
+    # Figures are sent whole with the layout; callbacks only patch
+    # the trace data so layout JSON is not re-serialized each time
+    dist_fig = Patch()
+    dist_fig['data'][0]['x'] = state_counts.index.to_numpy()
+    dist_fig['data'][0]['y'] = state_counts.to_numpy()
+
+    status_fig = Patch()
+    status_fig['data'][0]['labels'] = status_counts.index.to_numpy()
+    status_fig['data'][0]['values'] = status_counts.to_numpy()
+    status_fig['data'][0]['marker']['colors'] = status_colors(status_counts.index)
+
+    return dist_fig, status_fig, table_data
+
 # Callbacks
 @app.callback(
     [Output('distribution-chart', 'figure'),
      Output('status-chart', 'figure'),
-     Output('data-table', 'children')],
+     Output('data-table', 'data')],
     [Input('state-filter', 'value'),
      Input('status-filter', 'value')]
 )
 def update_dashboard(state_value, status_value):
-    # Filter data
-    filtered_df = df.copy()
-
-    if state_value != 'all':
-        filtered_df = filtered_df[filtered_df['state_fips'] == state_value]
-
-    if status_value != 'all':
-        filtered_df = filtered_df[filtered_df['scrape_status'] == status_value]
-
-    # Distribution chart
-    state_counts = filtered_df['state_fips'].value_counts().reset_index()
-    state_counts.columns = ['state_fips', 'count']
-
-    dist_fig = px.bar(
-        state_counts,
-        x='state_fips',
-        y='count',
-        title='Counties by State FIPS',
-        labels={'state_fips': 'State FIPS', 'count': 'Number of Counties'}
-    )
-    dist_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Arial, sans-serif")
-    )
-
-    # Status chart
-    status_counts = filtered_df['scrape_status'].value_counts().reset_index()
-    status_counts.columns = ['status', 'count']
-
-    status_fig = px.pie(
-        status_counts,
-        values='count',
-        names='status',
-        title='Scraping Status Distribution',
-        color='status',
-        color_discrete_map={'success': '#2ecc71', 'error': '#e74c3c'}
-    )
-    status_fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Arial, sans-serif")
-    )
-
-    # Data table
-    table_data = filtered_df[['geoid', 'state_fips', 'county_fips',
-                              'scrape_status', 'page_title']].head(20)
-
-    table = html.Table([
-        html.Thead(
-            html.Tr([html.Th(col, style={'padding': '10px', 'backgroundColor': '#3498db',
-                                         'color': 'white', 'textAlign': 'left'})
-                    for col in table_data.columns])
-        ),
-        html.Tbody([
-            html.Tr([
-                html.Td(table_data.iloc[i][col],
-                       style={'padding': '10px', 'borderBottom': '1px solid #ddd'})
-                for col in table_data.columns
-            ]) for i in range(len(table_data))
-        ])
-    ], style={'width': '100%', 'borderCollapse': 'collapse'})
-
-    return dist_fig, status_fig, table
+    return build_outputs(state_value, status_value)
 
 # For local testing
 if __name__ == '__main__':
@@ -3,11 +3,59 @@ Prepare data for Vercel deployment
 Converts processed CSV data to JSON format for the dashboard
 """
 
+import gzip
 import json
 import pandas as pd
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Columns the dashboards read (vercel_app table/charts, map_app hover and stats).
+# Heavy scraper fields such as page_content and screenshot are left out; add a
+# column here before using it in a dashboard.
+DASHBOARD_COLUMNS = [
+    'geoid', 'state_fips', 'county_fips', 'scrape_status', 'page_title', 'timestamp',
+    'county_name', 'state', 'population', 'solar_potential_mw', 'wind_potential_mw',
+    'energy_burden_pct', 'lat', 'lon',
+]
+
+def read_processed_csv(csv_path):
+    """Read a processed CSV, keeping only DASHBOARD_COLUMNS"""
+    if HAS_PYARROW:
+        # Multi-threaded Arrow reader; timestamps stay as the scraper wrote
+        # them and empty cells become nulls, matching pandas' parser
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={'timestamp': pa.string()},
+                strings_can_be_null=True,
+            ),
+        )
+        columns = [col for col in DASHBOARD_COLUMNS if col in table.column_names]
+        return table.select(columns).to_pandas()
+
+    df = pd.read_csv(csv_path, usecols=lambda col: col in DASHBOARD_COLUMNS)
+    return df[[col for col in DASHBOARD_COLUMNS if col in df.columns]]
+
 def prepare_dashboard_data():
     """Prepare dashboard data for Vercel deployment"""
     
@@ -27,38 +75,42 @@ def prepare_dashboard_data():
     latest_csv = csv_files[0]
     print(f"Loading data from: {latest_csv}")
     
-    # Load CSV data
-    df = pd.read_csv(latest_csv)
-    
-    # Convert DataFrame to JSON-serializable format
-    # Handle NaN values and complex types
-    data_dict = df.to_dict(orient='records')
-    
-    # Clean up the data for JSON serialization
-    cleaned_data = []
-    for record in data_dict:
-        cleaned_record = {}
-        for key, value in record.items():
-            # Convert NaN to None
-            if pd.isna(value):
-                cleaned_record[key] = None
-            # Convert numpy types to Python native types
-            elif hasattr(value, 'item'):
-                cleaned_record[key] = value.item()
-            else:
-                cleaned_record[key] = value
-        cleaned_data.append(cleaned_record)
+    # Load CSV data, keeping only what the dashboards display
+    df = read_processed_csv(latest_csv)
     
     # Create output directory if it doesn't exist
     output_dir = Path("dashboard/data")
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Save as JSON
+    # Columnar copy for the dashboard; Arrow keeps dtypes and NaN as-is
+    if HAS_PYARROW:
+        parquet_file = output_dir / "dashboard_data.parquet"
+        df.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+        print(f"✓ Parquet data saved to: {parquet_file}")
+    
+    # Convert DataFrame to JSON-serializable format
+    # Casting to object yields native Python scalars, and NaN becomes None
+    cleaned_data = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+    
+    # Save as compact JSON (indentation roughly doubles the file size)
     output_file = output_dir / "dashboard_data.json"
-    with open(output_file, 'w') as f:
-        json.dump(cleaned_data, f, indent=2, default=str)
+    if HAS_ORJSON:
+        json_bytes = orjson.dumps(cleaned_data, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        json_bytes = json.dumps(cleaned_data, default=str, separators=(',', ':')).encode('utf-8')
+    output_file.write_bytes(json_bytes)
     
     print(f"✓ Dashboard data saved to: {output_file}")
+    
+    # Precompressed copies, so the deployed bundle carries a fraction of the bytes
+    gz_file = output_file.with_name(output_file.name + ".gz")
+    gz_file.write_bytes(gzip.compress(json_bytes, compresslevel=9))
+    print(f"✓ Compressed copy saved to: {gz_file}")
+    
+    if HAS_BROTLI:
+        br_file = output_file.with_name(output_file.name + ".br")
+        br_file.write_bytes(brotli.compress(json_bytes, quality=11))
+        print(f"✓ Compressed copy saved to: {br_file}")
     print(f"✓ Total records: {len(cleaned_data)}")
     
     # Print summary statistics
@@ -88,7 +140,7 @@ if __name__ == "__main__":
     print("="*60)
     print()
     print("Next steps:")
-    print("  1. Commit the data: git add dashboard/data/dashboard_data.json")
+    print("  1. Commit the data: git add dashboard/data/dashboard_data.json*")
     print("  2. Push to GitHub: git push origin main")
     print("  3. Deploy to Vercel: vercel deploy --prod")
     print("="*60)
@@ -2,5 +2,6 @@
 
 from .scraper_agent import ScraperAgent
 from .data_parser import DataParser
+from .browser_pool import BrowserPool
 
-__all__ = ['ScraperAgent', 'DataParser']
+__all__ = ['ScraperAgent', 'DataParser', 'BrowserPool']
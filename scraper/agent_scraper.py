@@ -14,12 +14,22 @@ from tqdm import tqdm
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.geoid_generator import GeoIDGenerator
 from utils.data_storage import DataStorage
+from utils.rate_limiter import RateLimiter
+from utils.log_setup import setup_logging
+from utils.event_loop import run_main
 from scraper.scraper_agent import ScraperAgent
 
 
 class AgentOrchestrator:
     """Orchestrate multiple scraper agents"""
 
+    # Retry policy for throttled (429) and server-side (5xx) failures
+    MAX_RETRIES = 3
+    BACKOFF_SECONDS = 2
+
+    # Results are appended to disk every FLUSH_EVERY counties per agent
+    FLUSH_EVERY = 50
+
     def __init__(self, num_agents=5, start_geoid="G0100010", end_geoid="G5600450", headless=True):
         """
         Initialize agent orchestrator
@@ -38,8 +48,56 @@ class AgentOrchestrator:
         self.generator = GeoIDGenerator(start_geoid, end_geoid)
         self.storage = DataStorage()
 
-        self.results = []
-        self.errors = []
+        # One request per agent per second overall, shared across agents
+        self.limiter = RateLimiter(max_rate=num_agents, time_period=1.0)
+
+        # Running totals; the records themselves stream to an NDJSON file
+        self.total_scraped = 0
+        self.successful = 0
+        self.error_count = 0
+        self.results_file = f"scrape_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+
+    @staticmethod
+    def is_retryable(result):
+        """
+        Check whether a failed scrape is worth retrying
+
+        Args:
+            result (dict): Record returned by ScraperAgent.scrape_county
+
+        Returns:
+            bool: True for HTTP 429 and 5xx errors
+        """
+        if result.get('status') != 'error':
+            return False
+
+        error = str(result.get('error', ''))
+        if not error.startswith('HTTP '):
+            return False
+
+        code = error.split()[1]
+        return code.isdigit() and (int(code) == 429 or int(code) >= 500)
+
+    async def scrape_with_retry(self, agent, geoid):
+        """
+        Scrape one county under the shared rate limit
+
+        Args:
+            agent (ScraperAgent): Initialized agent
+            geoid (str): County GeoID
+
+        Returns:
+            dict: Scraped county data
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with self.limiter:
+                result = await agent.scrape_county(geoid)
+
+            if attempt == self.MAX_RETRIES or not self.is_retryable(result):
+                return result
+
+            # Exponential backoff only when the server pushes back
+            await asyncio.sleep(self.BACKOFF_SECONDS * 2 ** attempt)
 
     async def scrape_with_agent(self, agent_id, geoids, pbar=None):
         """
@@ -47,40 +105,51 @@ class AgentOrchestrator:
 
         Args:
             agent_id (int): Agent identifier
-            geoids (list): List of GeoIDs for this agent
+            geoids (iterator): GeoID iterator shared by all agents
             pbar (tqdm): Progress bar
 
         Returns:
-            list: Scraped results
+            int: Number of counties scraped by this agent
         """
         agent = ScraperAgent(agent_id=agent_id, headless=self.headless)
-        results = []
+        buffer = []
+        scraped = 0
 
         try:
             await agent.initialize()
 
+            # Pull work until the shared iterator is drained, so agents that
+            # hit fast counties pick up slack from slower ones. next() runs
+            # between awaits, so each GeoID goes to exactly one agent.
             for geoid in geoids:
-                result = await agent.scrape_county(geoid)
-                results.append(result)
+                result = await self.scrape_with_retry(agent, geoid)
+                buffer.append(result)
+                scraped += 1
+
+                # Track totals
+                self.total_scraped += 1
+                if result.get('status') == 'success':
+                    self.successful += 1
+                elif result.get('status') == 'error':
+                    self.error_count += 1
 
-                # Track errors
-                if result.get('status') == 'error':
-                    self.errors.append(result)
+                if len(buffer) >= self.FLUSH_EVERY:
+                    self.storage.append_ndjson(buffer, self.results_file)
+                    buffer.clear()
 
                 # Update progress bar
                 if pbar:
                     pbar.update(1)
 
-                # Small delay between requests
-                await asyncio.sleep(1)
-
         except Exception as e:
             print(f"\n[Agent {agent_id}] Fatal error: {str(e)}")
 
         finally:
+            if buffer:
+                self.storage.append_ndjson(buffer, self.results_file)
             await agent.cleanup()
 
-        return results
+        return scraped
 
     async def run(self):
         """
@@ -95,40 +164,26 @@ class AgentOrchestrator:
         print(f"GeoID Range: {self.start_geoid} to {self.end_geoid}")
         print(f"Number of Agents: {self.num_agents}")
 
-        # Split work among agents
-        agent_ranges = self.generator.split_for_agents(self.num_agents)
-
-        print(f"\nAgent Work Distribution:")
-        total_geoids = 0
-        for i, (start, end) in enumerate(agent_ranges, 1):
-            # Calculate geoids for this range
-            gen = GeoIDGenerator(start, end)
-            count = gen.count_total()
-            total_geoids += count
-            print(f"  Agent {i}: {start} to {end} ({count} counties)")
+        # All agents share one lazy GeoID iterator instead of fixed shards;
+        # the total comes from arithmetic, so nothing is materialized
+        geoids = self.generator.generate_range()
+        total_geoids = self.generator.count_total()
 
         print(f"\nTotal GeoIDs to scrape: {total_geoids}")
         print(f"{'='*60}\n")
 
         # Prepare agent tasks
-        tasks = []
         pbar = tqdm(total=total_geoids, desc="Scraping progress", unit="county")
-
-        for i, (start, end) in enumerate(agent_ranges, 1):
-            gen = GeoIDGenerator(start, end)
-            geoids = list(gen.generate_range())
-            task = self.scrape_with_agent(i, geoids, pbar)
-            tasks.append(task)
+        tasks = [
+            self.scrape_with_agent(i, geoids, pbar)
+            for i in range(1, self.num_agents + 1)
+        ]
 
         # Run all agents in parallel
         start_time = datetime.now()
         print(f"Started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-        all_results = await asyncio.gather(*tasks)
-
-        # Flatten results
-        for agent_results in all_results:
-            self.results.extend(agent_results)
+        await asyncio.gather(*tasks)
 
         pbar.close()
 
@@ -137,13 +192,13 @@ class AgentOrchestrator:
         duration = (end_time - start_time).total_seconds()
 
         stats = {
-            "total_scraped": len(self.results),
-            "successful": sum(1 for r in self.results if r.get('status') == 'success'),
-            "errors": len(self.errors),
+            "total_scraped": self.total_scraped,
+            "successful": self.successful,
+            "errors": self.error_count,
             "duration_seconds": duration,
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat(),
-            "geoids_per_second": len(self.results) / duration if duration > 0 else 0
+            "geoids_per_second": self.total_scraped / duration if duration > 0 else 0
         }
 
         # Save results
@@ -162,25 +217,40 @@ class AgentOrchestrator:
         print("Saving Results...")
         print(f"{'='*60}")
 
-        # Save all results to JSON
+        # All results were already streamed to NDJSON during the run; the
+        # batch file is what DataParser.load_and_process_all reads
+        results = self.storage.load_ndjson(self.results_file)
         results_file = self.storage.save_batch_data(
-            self.results,
-            filename=f"scrape_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            results,
+            filename=Path(self.results_file).with_suffix(".json").name
         )
         print(f"✓ Results saved to: {results_file}")
 
+        # The NDJSON log only guarded the run against crashes
+        (self.storage.processed_dir / self.results_file).unlink(missing_ok=True)
+
         # Save to CSV
         csv_file = self.storage.save_to_csv(
-            self.results,
+            results,
             filename=f"counties_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         )
         print(f"✓ CSV saved to: {csv_file}")
 
+        # Columnar copy for fast dashboard loads (skipped without pyarrow)
+        parquet_file = self.storage.save_to_parquet(
+            results,
+            filename=f"counties_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+        )
+        if parquet_file:
+            print(f"✓ Parquet saved to: {parquet_file}")
+
         # Save errors separately
-        if self.errors:
+        errors = [r for r in results if r.get('status') == 'error']
+        if errors:
             error_file = self.storage.save_batch_data(
-                self.errors,
-                filename=f"scrape_errors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                errors,
+                filename=f"scrape_errors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                format="json"
             )
             print(f"✓ Errors saved to: {error_file}")
 
@@ -228,6 +298,9 @@ async def main():
 
     args = parser.parse_args()
 
+    # Per-county agent messages go to scrape.log, off the progress bar
+    setup_logging()
+
     # Test mode uses smaller range
     if args.test:
         start_geoid = "G0100010"
@@ -261,5 +334,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run_main(main())
     sys.exit(exit_code)
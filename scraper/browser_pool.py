@@ -0,0 +1,111 @@
+"""
+Browser Pool
+Share a few long-lived browsers between many scraper agents
+"""
+
+import asyncio
+from playwright.async_api import async_playwright
+
+
+class BrowserPool:
+    """Hand out isolated browser contexts from a small set of shared browsers"""
+
+    # Contexts a browser opens before it is replaced, to cap native memory growth
+    RECYCLE_AFTER = 100
+
+    def __init__(self, size=3, headless=True, recycle_after=RECYCLE_AFTER):
+        """
+        Initialize browser pool
+
+        Args:
+            size (int): Number of browsers to keep running
+            headless (bool): Run browsers in headless mode
+            recycle_after (int): Contexts per browser before it is relaunched
+        """
+        self.size = size
+        self.headless = headless
+        self.recycle_after = recycle_after
+
+        self.playwright = None
+        self.browsers = []
+        self.created = []
+        self.locks = []
+        self.next_slot = 0
+
+        # Open contexts per browser and the browser each context belongs to
+        self.active = {}
+        self.owners = {}
+
+    async def start(self):
+        """Start Playwright and launch every browser up front"""
+        self.playwright = await async_playwright().start()
+        self.browsers = list(await asyncio.gather(*(self.launch() for _ in range(self.size))))
+        self.created = [0] * self.size
+        self.locks = [asyncio.Lock() for _ in range(self.size)]
+
+    async def launch(self):
+        """Launch one browser"""
+        browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.active[browser] = 0
+        return browser
+
+    async def new_context(self, **kwargs):
+        """
+        Open a context on the next browser in turn
+
+        Args:
+            **kwargs: Passed to Browser.new_context
+
+        Returns:
+            BrowserContext: New context; give it back with close_context
+        """
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % self.size
+
+        # One context creation (or relaunch) per browser at a time
+        async with self.locks[slot]:
+            if self.created[slot] >= self.recycle_after:
+                retired = self.browsers[slot]
+                self.browsers[slot] = await self.launch()
+                self.created[slot] = 0
+                await self.close_if_idle(retired)
+
+            browser = self.browsers[slot]
+            context = await browser.new_context(**kwargs)
+            self.created[slot] += 1
+
+        self.active[browser] += 1
+        self.owners[context] = browser
+        return context
+
+    async def close_context(self, context):
+        """
+        Close a context from new_context
+
+        Args:
+            context (BrowserContext): Context to close
+        """
+        browser = self.owners.pop(context)
+        try:
+            await context.close()
+        finally:
+            self.active[browser] -= 1
+            await self.close_if_idle(browser)
+
+    async def close_if_idle(self, browser):
+        """Close a recycled browser once its last context is gone"""
+        if browser not in self.browsers and self.active.get(browser) == 0:
+            del self.active[browser]
+            await browser.close()
+
+    async def close(self):
+        """Close every browser and stop Playwright"""
+        for browser in list(self.active):
+            await browser.close()
+        self.active.clear()
+        self.owners.clear()
+        self.browsers = []
+
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
@@ -3,20 +3,100 @@ Data Parser
 Parse and clean scraped NREL SLOPE county data
 """
 
+import os
 import re
 import json
 from datetime import datetime
 import pandas as pd
 from pathlib import Path
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.data_storage import DataStorage
+from utils.data_storage import DataStorage, HAS_PYARROW, json_loads
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    # Optional: multi-pattern metric scanning (Linux/macOS builds)
+    HAS_HYPERSCAN = False
+
+
+def _compile_metric_database(patterns):
+    """Compile (name, pattern) pairs into one Hyperscan block database"""
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+             | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH)
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode() for _, pattern in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[flags] * len(patterns),
+    )
+    return database
 
 
 class DataParser:
     """Parse and structure scraped county data"""
 
+    # Common energy metric patterns. Label-to-value gaps are bounded
+    # ({0,120}) so pages without a match fail fast instead of backtracking
+    # across the whole page text.
+    METRIC_PATTERNS = (
+        ('population', r'Population[:\s]+([0-9,]+)'),
+        ('households', r'Households[:\s]+([0-9,]+)'),
+        ('solar_potential', r'Solar[^:]{0,120}[:\s]+([0-9][0-9,.]*)\s*(?:MW|GW|kW)'),
+        ('wind_potential', r'Wind[^:]{0,120}[:\s]+([0-9][0-9,.]*)\s*(?:MW|GW|kW)'),
+        ('energy_burden', r'Energy\s+Burden[:\s]+([0-9.]+)%?'),
+        ('renewable_percent', r'Renewable[^:]{0,120}[:\s]+([0-9.]+)%?'),
+    )
+
+    # All patterns fused into one compiled pass over the page. Alternatives
+    # sit inside a lookahead so overlapping labels still match as separate
+    # searches would. Labels must start a word; the word boundary and the
+    # class of label initials skip every other position cheaply.
+    METRIC_REGEX = re.compile(
+        r'\b(?=[ehprsw])(?='
+        + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in METRIC_PATTERNS)
+        + ')',
+        re.IGNORECASE
+    )
+
+    # With Hyperscan, one scan finds which metrics occur at all and only
+    # those are searched with their own regex. Hyperscan has no \b in UCP
+    # mode, so it may flag extra candidates; the regex search settles them.
+    METRIC_SEARCHES = tuple(
+        (name, re.compile(r'\b' + pattern, re.IGNORECASE))
+        for name, pattern in METRIC_PATTERNS
+    )
+    METRIC_DATABASE = _compile_metric_database(METRIC_PATTERNS) if HAS_HYPERSCAN else None
+
+    # Processed output columns
+    COLUMNS = (
+        'geoid', 'timestamp', 'scrape_status', 'state_fips', 'county_fips',
+        'full_fips', 'valid', 'page_title', 'metrics', 'content_preview', 'error',
+    )
+
+    # Columns parse_row returns; the GeoID parts are filled in per batch
+    ROW_COLUMNS = (
+        'geoid', 'timestamp', 'scrape_status', 'page_title', 'metrics',
+        'content_preview', 'error',
+    )
+
+    # Repeated labels stored as pandas categoricals in processed frames
+    CATEGORY_DTYPES = {'state_fips': 'category', 'scrape_status': 'category'}
+
+    # Batches at least this large are parsed across worker processes;
+    # smaller ones finish before a pool could start
+    PARALLEL_MIN_RECORDS = 2000
+    PARALLEL_CHUNKSIZE = 64
+
+    # Parsed records from earlier runs (under processed/), reused while the
+    # JSON files they came from are unchanged
+    CACHE_FILE = "cache/parsed_records.parquet"
+    CACHE_MANIFEST = "cache/parsed_records_files.json"
+
     def __init__(self):
         self.storage = DataStorage()
 
@@ -47,7 +127,29 @@ class DataParser:
             "valid": True
         }
 
-    def extract_metrics(self, raw_data):
+    def parse_geoids(self, geoids):
+        """
+        Parse a whole column of GeoIDs at once (vectorized parse_geoid)
+
+        Args:
+            geoids (pd.Series): GeoID strings
+
+        Returns:
+            pd.DataFrame: state_fips, county_fips, full_fips and valid columns
+        """
+        geoids = geoids.astype(object)
+        valid = geoids.str.startswith('G', na=False) & geoids.str.len().eq(8)
+        numeric = geoids.str.slice(1).where(valid)
+
+        return pd.DataFrame({
+            "state_fips": numeric.str.slice(0, 2),
+            "county_fips": numeric.str.slice(2),
+            "full_fips": numeric,
+            "valid": valid,
+        })
+
+    @classmethod
+    def extract_metrics(cls, raw_data):
         """
         Extract energy metrics from raw scraped data
 
@@ -63,20 +165,20 @@ class DataParser:
         if 'page_content' in raw_data:
             content = raw_data['page_content']
 
-            # Look for common energy metrics patterns
-            patterns = {
-                'population': r'Population[:\s]+([0-9,]+)',
-                'households': r'Households[:\s]+([0-9,]+)',
-                'solar_potential': r'Solar[^:]*[:\s]+([0-9,.]+)\s*(MW|GW|kW)',
-                'wind_potential': r'Wind[^:]*[:\s]+([0-9,.]+)\s*(MW|GW|kW)',
-                'energy_burden': r'Energy\s+Burden[:\s]+([0-9.]+)%?',
-                'renewable_percent': r'Renewable[^:]*[:\s]+([0-9.]+)%?',
-            }
-
-            for metric_name, pattern in patterns.items():
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    value = match.group(1).replace(',', '')
+            found = cls.scan_metrics(content) if cls.METRIC_DATABASE is not None else None
+
+            if found is None:
+                # First match of each metric, stopping once all are found
+                found = {}
+                for match in cls.METRIC_REGEX.finditer(content):
+                    found.setdefault(match.lastgroup, match.group(match.lastindex + 1))
+                    if len(found) == len(cls.METRIC_PATTERNS):
+                        break
+
+            # Record them in pattern order, as the per-pattern searches did
+            for metric_name, _ in cls.METRIC_PATTERNS:
+                if metric_name in found:
+                    value = found[metric_name].replace(',', '')
                     try:
                         metrics[metric_name] = float(value)
                     except:
@@ -90,6 +192,69 @@ class DataParser:
 
         return metrics
 
+    @classmethod
+    def scan_metrics(cls, content):
+        """
+        Find the first value of each metric using the Hyperscan database
+
+        Args:
+            content (str): Page text
+
+        Returns:
+            dict: Raw matched values by metric name, or None if the text
+                cannot be scanned (the regex path is used instead)
+        """
+        try:
+            data = content.encode('utf-8')
+        except UnicodeEncodeError:
+            return None
+
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+            # A true return value stops the scan
+            return len(hits) == len(cls.METRIC_PATTERNS)
+
+        try:
+            cls.METRIC_DATABASE.scan(data, match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+
+        found = {}
+        for pattern_id in hits:
+            name, regex = cls.METRIC_SEARCHES[pattern_id]
+            match = regex.search(content)
+            if match:
+                found[name] = match.group(1)
+        return found
+
+    @classmethod
+    def parse_row(cls, raw_data):
+        """
+        Parse raw scraped data into a row ordered like ROW_COLUMNS
+
+        Only uses class attributes, so it pickles by reference and can be
+        mapped over worker processes.
+
+        Args:
+            raw_data (dict): Raw data from scraper
+
+        Returns:
+            tuple: Structured county data
+        """
+        return (
+            raw_data.get('geoid'),
+            raw_data.get('timestamp'),
+            raw_data.get('status'),
+            raw_data.get('page_title'),
+            cls.extract_metrics(raw_data),
+            # Store first 500 chars of content as preview
+            raw_data['page_content'][:500] if 'page_content' in raw_data else None,
+            # Error information
+            raw_data.get('error') if raw_data.get('status') == 'error' else None,
+        )
+
     def parse_raw_data(self, raw_data):
         """
         Parse raw scraped data into structured format
@@ -100,34 +265,13 @@ class DataParser:
         Returns:
             dict: Structured county data
         """
-        parsed = {
-            "geoid": raw_data.get('geoid'),
-            "timestamp": raw_data.get('timestamp'),
-            "scrape_status": raw_data.get('status'),
-        }
+        parsed = dict(zip(self.ROW_COLUMNS, self.parse_row(raw_data)))
 
         # Parse GeoID
         geoid_info = self.parse_geoid(raw_data.get('geoid', ''))
         parsed.update(geoid_info)
 
-        # Extract title/name
-        if 'page_title' in raw_data:
-            parsed['page_title'] = raw_data['page_title']
-
-        # Extract metrics
-        metrics = self.extract_metrics(raw_data)
-        parsed['metrics'] = metrics
-
-        # Add raw content reference
-        if 'page_content' in raw_data:
-            # Store first 500 chars as preview
-            parsed['content_preview'] = raw_data['page_content'][:500]
-
-        # Error information
-        if raw_data.get('status') == 'error':
-            parsed['error'] = raw_data.get('error')
-
-        return parsed
+        return {col: parsed.get(col) for col in self.COLUMNS}
 
     def process_batch(self, raw_data_list):
         """
@@ -139,31 +283,116 @@ class DataParser:
         Returns:
             pd.DataFrame: Processed data
         """
-        parsed_records = []
+        # Fixed-width tuples with known columns skip pandas' per-dict
+        # schema inference and are fed in without an intermediate list
+        if len(raw_data_list) >= self.PARALLEL_MIN_RECORDS and (os.cpu_count() or 1) > 1:
+            # The regex scan is CPU-bound per record, so spread it past the GIL
+            with ProcessPoolExecutor() as executor:
+                df = pd.DataFrame.from_records(
+                    executor.map(self.parse_row, raw_data_list, chunksize=self.PARALLEL_CHUNKSIZE),
+                    columns=self.ROW_COLUMNS
+                )
+        else:
+            df = pd.DataFrame.from_records(
+                map(self.parse_row, raw_data_list),
+                columns=self.ROW_COLUMNS
+            )
+
+        # GeoID parts come from one vectorized pass over the column
+        df = df.join(self.parse_geoids(df['geoid']))
+
+        # Low-cardinality labels as small integer codes instead of strings
+        df = df.astype(self.CATEGORY_DTYPES)
+        return df[list(self.COLUMNS)]
+
+    def load_parse_cache(self, source_files):
+        """
+        Load cached parsed records if their source files are unchanged
 
-        for raw_data in raw_data_list:
-            parsed = self.parse_raw_data(raw_data)
-            parsed_records.append(parsed)
+        Args:
+            source_files (dict): Current JSON file names mapped to mtime_ns
 
-        df = pd.DataFrame(parsed_records)
-        return df
+        Returns:
+            tuple: Cached DataFrame (or None) and the file names still to parse
+        """
+        cache_file = self.storage.processed_dir / self.CACHE_FILE
+        manifest_file = self.storage.processed_dir / self.CACHE_MANIFEST
+
+        if not HAS_PYARROW or not (cache_file.exists() and manifest_file.exists()):
+            return None, list(source_files)
+
+        cached_files = json.loads(manifest_file.read_text(encoding='utf-8'))
+
+        # An edited or deleted source file invalidates the whole cache
+        if any(source_files.get(name) != mtime for name, mtime in cached_files.items()):
+            return None, list(source_files)
+
+        df = pd.read_parquet(cache_file)
+        df['metrics'] = df['metrics'].map(json_loads)
+
+        return df, [name for name in source_files if name not in cached_files]
+
+    def save_parse_cache(self, df, source_files):
+        """
+        Save parsed records and the source files they were built from
+
+        Args:
+            df (pd.DataFrame): Processed data
+            source_files (dict): JSON file names mapped to mtime_ns
+        """
+        if not HAS_PYARROW or df.empty:
+            return
+
+        (self.storage.processed_dir / self.CACHE_FILE).parent.mkdir(exist_ok=True)
+
+        # save_to_parquet stores the metrics dicts as JSON strings
+        self.storage.save_to_parquet(df, filename=self.CACHE_FILE)
+
+        # Written last, so a partial save is never trusted
+        manifest_file = self.storage.processed_dir / self.CACHE_MANIFEST
+        manifest_file.write_text(json.dumps(source_files), encoding='utf-8')
 
     def load_and_process_all(self):
         """
         Load all raw data and process it
 
+        Only files added since the last run are parsed; earlier records come
+        from the Parquet cache when pyarrow is installed.
+
         Returns:
             pd.DataFrame: Processed data
         """
         print("Loading raw data...")
-        raw_data = self.storage.load_all_data()
+        source_files = {
+            path.name: path.stat().st_mtime_ns
+            for path in self.storage.batch_files()
+        }
+        cached, pending = self.load_parse_cache(source_files)
+        raw_data = self.storage.load_all_data(
+            files=[self.storage.processed_dir / name for name in pending]
+        )
 
-        if not raw_data:
+        if cached is None and not raw_data:
             print("No raw data found")
             return pd.DataFrame()
 
-        print(f"Processing {len(raw_data)} records...")
-        df = self.process_batch(raw_data)
+        frames = []
+        if cached is not None:
+            print(f"Reusing {len(cached)} cached records...")
+            frames.append(cached)
+
+        if raw_data:
+            print(f"Processing {len(raw_data)} records...")
+            frames.append(self.process_batch(raw_data))
+
+        if len(frames) > 1:
+            # Category sets differ between frames, so re-derive them
+            df = pd.concat(frames, ignore_index=True).astype(self.CATEGORY_DTYPES)
+        else:
+            df = frames[0]
+
+        if raw_data:
+            self.save_parse_cache(df, source_files)
 
         # Save processed data
         output_file = self.storage.save_to_csv(
@@ -184,10 +413,13 @@ class DataParser:
         Returns:
             dict: Summary statistics
         """
+        # One pass over the status column instead of a filtered copy per status
+        status_counts = df['scrape_status'].value_counts()
+
         summary = {
             "total_records": len(df),
-            "successful_scrapes": len(df[df['scrape_status'] == 'success']),
-            "failed_scrapes": len(df[df['scrape_status'] == 'error']),
+            "successful_scrapes": int(status_counts.get('success', 0)),
+            "failed_scrapes": int(status_counts.get('error', 0)),
             "unique_states": df['state_fips'].nunique() if 'state_fips' in df else 0,
             "date_processed": datetime.now().isoformat()
         }
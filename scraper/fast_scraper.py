@@ -12,18 +12,28 @@ from pathlib import Path
 from datetime import datetime
 from tqdm import tqdm
 import json
+from playwright.async_api import async_playwright
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.geoid_generator import GeoIDGenerator
 from utils.data_storage import DataStorage
+from utils.rate_limiter import RateLimiter
+from utils.log_setup import setup_logging
+from utils.event_loop import run_main
 from scraper.scraper_agent import ScraperAgent
 
 
 class FastScraper:
     """Ultra-fast multi-agent scraper optimized for performance"""
 
-    def __init__(self, num_agents=15, start_geoid="G0100010", end_geoid="G5600450"):
+    # Raw results are written in batches of this size to prevent data loss
+    RAW_BATCH_SIZE = 10
+    # Results waiting for the writer before agents have to pause
+    WRITE_QUEUE_SIZE = 200
+
+    def __init__(self, num_agents=15, start_geoid="G0100010", end_geoid="G5600450", qps=None,
+                 screenshot=False, keep_raw=False, resume=False):
         self.num_agents = num_agents
         self.start_geoid = start_geoid
         self.end_geoid = end_geoid
@@ -32,6 +42,16 @@ class FastScraper:
         self.results = []
         self.errors = []
         self.should_stop = False
+        self.write_queue = None
+        self.browser = None
+        self.screenshot = screenshot
+        self.keep_raw = keep_raw
+        self.resume = resume
+
+        # Global request budget shared by all agents (default: 2/s per agent,
+        # the pace the old fixed 0.5s sleep allowed)
+        self.qps = qps or num_agents * 2
+        self.limiter = RateLimiter(max_rate=self.qps, time_period=1.0)
 
         # Setup signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -42,9 +62,28 @@ class FastScraper:
         print("Saving collected data...")
         self.should_stop = True
 
+    async def raw_writer(self):
+        """Background task that saves queued raw results in batches"""
+        batch = []
+        while True:
+            result = await self.write_queue.get()
+            if result is not None:
+                batch.append(result)
+
+            # None is the shutdown sentinel: flush what is left and stop
+            if batch and (result is None or len(batch) >= self.RAW_BATCH_SIZE):
+                await asyncio.to_thread(self.storage.save_raw_batch, batch)
+                batch = []
+
+            if result is None:
+                return
+
     async def scrape_with_agent(self, agent_id, geoids, pbar=None):
         """Fast scraping with a single agent"""
-        agent = ScraperAgent(agent_id=agent_id, headless=True, timeout=15000)
+        # Each agent only opens a context in the shared browser
+        agent = ScraperAgent(agent_id=agent_id, headless=True, timeout=15000,
+                             browser=self.browser, screenshot=self.screenshot,
+                             keep_raw=self.keep_raw)
         results = []
 
         try:
@@ -54,7 +93,8 @@ class FastScraper:
                 if self.should_stop:
                     break
 
-                result = await agent.scrape_county(geoid)
+                async with self.limiter:
+                    result = await agent.scrape_county(geoid)
                 results.append(result)
 
                 # Track errors
@@ -65,13 +105,9 @@ class FastScraper:
                 if pbar:
                     pbar.update(1)
 
-                # Save every 10 results to prevent data loss
-                if len(results) % 10 == 0:
-                    for r in results[-10:]:
-                        self.storage.save_raw_data(r['geoid'], r)
-
-                # Minimal delay for politeness
-                await asyncio.sleep(0.5)
+                # Saved by the background writer; the agent moves straight
+                # on to the next county instead of waiting on disk
+                await self.write_queue.put(result)
 
         except Exception as e:
             print(f"\n[Agent {agent_id}] Fatal error: {str(e)}")
@@ -88,16 +124,31 @@ class FastScraper:
         print(f"{'='*70}")
         print(f"GeoID Range: {self.start_geoid} to {self.end_geoid}")
         print(f"Parallel Agents: {self.num_agents}")
+        print(f"Rate Limit: {self.qps} requests/second")
         print(f"Mode: MAXIMUM SPEED")
 
+        # Resuming skips every GeoID that already has a raw record
+        scraped = frozenset(self.storage.raw_index()) if self.resume else None
+        if self.resume:
+            print(f"Resuming: {len(scraped)} counties already scraped")
+
         # Split work among agents
         agent_ranges = self.generator.split_for_agents(self.num_agents)
 
         print(f"\nAgent Work Distribution:")
         total_geoids = 0
+        agent_geoids = []
         for i, (start, end) in enumerate(agent_ranges, 1):
-            gen = GeoIDGenerator(start, end)
-            count = gen.count_total()
+            # count_total is arithmetic and generate_range is lazy, so one
+            # pass sizes each range and hands it over without building lists;
+            # a resumed range is counted with one extra pass over its IDs
+            agent_generator = GeoIDGenerator(start, end)
+            if self.resume:
+                count = sum(1 for _ in agent_generator.generate_unscraped(scraped))
+                agent_geoids.append(agent_generator.generate_unscraped(scraped))
+            else:
+                count = agent_generator.count_total()
+                agent_geoids.append(agent_generator.generate_range())
             total_geoids += count
             print(f"  Agent {i:2d}: {start} to {end} ({count:3d} counties)")
 
@@ -106,21 +157,34 @@ class FastScraper:
         print(f"{'='*70}\n")
 
         # Prepare agent tasks
-        tasks = []
         pbar = tqdm(total=total_geoids, desc="Scraping", unit="county",
                    bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]')
 
-        for i, (start, end) in enumerate(agent_ranges, 1):
-            gen = GeoIDGenerator(start, end)
-            geoids = list(gen.generate_range())
-            task = self.scrape_with_agent(i, geoids, pbar)
-            tasks.append(task)
+        tasks = [
+            self.scrape_with_agent(i, geoids, pbar)
+            for i, geoids in enumerate(agent_geoids, 1)
+        ]
 
         # Run all agents in parallel
         start_time = datetime.now()
         print(f"Started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-        all_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # One Chromium process for all agents instead of one per agent
+        playwright = await async_playwright().start()
+        self.browser = await playwright.chromium.launch(headless=True)
+
+        self.write_queue = asyncio.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        writer = asyncio.create_task(self.raw_writer())
+
+        try:
+            all_results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await self.browser.close()
+            await playwright.stop()
+
+        # Let the writer drain the queue before results are summarized
+        await self.write_queue.put(None)
+        await writer
 
         # Flatten results
         for agent_results in all_results:
@@ -158,7 +222,7 @@ class FastScraper:
 
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-        # Save all results to JSON
+        # Save all results (Feather, or JSON without pyarrow)
         results_file = self.storage.save_batch_data(
             self.results,
             filename=f"fast_scrape_results_{timestamp}.json"
@@ -172,11 +236,20 @@ class FastScraper:
         )
         print(f"✓ CSV: {csv_file}")
 
+        # Columnar copy for fast dashboard loads (skipped without pyarrow)
+        parquet_file = self.storage.save_to_parquet(
+            self.results,
+            filename=f"counties_data_{timestamp}.parquet"
+        )
+        if parquet_file:
+            print(f"✓ Parquet: {parquet_file}")
+
         # Save errors separately
         if self.errors:
             error_file = self.storage.save_batch_data(
                 self.errors,
-                filename=f"scrape_errors_{timestamp}.json"
+                filename=f"scrape_errors_{timestamp}.json",
+                format="json"
             )
             print(f"✓ Errors: {error_file}")
 
@@ -207,6 +280,9 @@ Examples:
 
   # Custom range
   python scraper/fast_scraper.py --start G0100010 --end G0200010 --agents 10
+
+  # Continue an interrupted scrape
+  python scraper/fast_scraper.py --agents 15 --resume
         """
     )
 
@@ -226,9 +302,33 @@ Examples:
         default=15,
         help="Number of parallel agents (default: 15, recommended: 10-20)"
     )
+    parser.add_argument(
+        "--qps",
+        type=float,
+        default=None,
+        help="Max requests per second across all agents (default: 2 per agent)"
+    )
+    parser.add_argument(
+        "--screenshots",
+        action="store_true",
+        help="Save a JPEG screenshot of every county page (slow, for debugging)"
+    )
+    parser.add_argument(
+        "--keep-raw",
+        action="store_true",
+        help="Store the full page text instead of the first 8KB"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip counties that already have raw data from an earlier run"
+    )
 
     args = parser.parse_args()
 
+    # Per-county agent messages go to scrape.log, off the progress bar
+    setup_logging()
+
     # Validate agent count
     if args.agents > 25:
         print("⚠️  Warning: More than 25 agents may cause rate limiting")
@@ -240,7 +340,11 @@ Examples:
     scraper = FastScraper(
         num_agents=args.agents,
         start_geoid=args.start,
-        end_geoid=args.end
+        end_geoid=args.end,
+        qps=args.qps,
+        screenshot=args.screenshots,
+        keep_raw=args.keep_raw,
+        resume=args.resume
     )
 
     try:
@@ -267,5 +371,5 @@ Examples:
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run_main(main())
     sys.exit(exit_code)
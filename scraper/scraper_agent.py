@@ -5,6 +5,7 @@ Individual agent for scraping NREL SLOPE county data
 
 import asyncio
 import json
+import logging
 import time
 from datetime import datetime
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
@@ -14,14 +15,54 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.data_storage import DataStorage
+from utils.log_setup import setup_logging
+from utils.event_loop import run_main
+
+logger = logging.getLogger(__name__)
 
 
 class ScraperAgent:
     """Individual scraper agent for NREL SLOPE data"""
 
     BASE_URL = "https://maps.nrel.gov/slope/energy-snapshot?geoId="
+    # Elements that only exist once the snapshot data has rendered
+    METRIC_SELECTOR = '[class*="metric"], [class*="stat"]'
+    METRIC_TIMEOUT = 8000
+    # Title of the generic page served for unknown GeoIDs (no county name in it)
+    INVALID_TITLE_PREFIX = "Energy Snapshot |"
+    # How long a generic title may take to become a county title before giving up
+    TITLE_TIMEOUT = 2000
+    # Only the DOM text is scraped, so these are never worth downloading
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+    # Third-party trackers that never carry county data
+    BLOCKED_URL_PATTERNS = ("analytics", "doubleclick", "crazyegg", "googletagmanager")
+    SCREENSHOT_DIR = Path("data/raw/screenshots")
+    # JPEG encodes several times faster and smaller than PNG; fine for debugging
+    SCREENSHOT_QUALITY = 60
+    # Characters of page text stored per county unless keep_raw is set
+    CONTENT_LIMIT = 8192
+    # scrape_batch writes raw records every FLUSH_EVERY counties
+    FLUSH_EVERY = 100
+
+    # Title, page text (optionally truncated) and metric element texts in a
+    # single round-trip. Text is taken from the main content root only;
+    # innerText is kept there because it separates block elements, which the
+    # parser's "Label: value" patterns rely on. Metric texts use textContent,
+    # which does not force a layout per element.
+    EXTRACT_SCRIPT = '''(limit) => {
+        const root = document.querySelector('main, #app, [role="main"]') || document.body;
+        const text = root.innerText;
+        const dataElements = root.querySelectorAll('[class*="metric"], [class*="stat"], [class*="value"]');
 
-    def __init__(self, agent_id, headless=True, timeout=30000):
+        return {
+            title: document.title,
+            text: limit ? text.slice(0, limit) : text,
+            stats: Array.from(dataElements, el => el.textContent.trim())
+        };
+    }'''
+
+    def __init__(self, agent_id, headless=True, timeout=30000, browser=None, screenshot=False,
+                 keep_raw=False):
         """
         Initialize scraper agent
 
@@ -29,25 +70,41 @@ class ScraperAgent:
             agent_id (int): Unique agent identifier
             headless (bool): Run browser in headless mode
             timeout (int): Page load timeout in milliseconds
+            browser (Browser): Shared browser to open a context in; the agent
+                launches (and later closes) its own when omitted
+            screenshot (bool): Save a JPEG of every scraped page (debugging only)
+            keep_raw (bool): Store the full page text instead of the first
+                CONTENT_LIMIT characters
         """
         self.agent_id = agent_id
         self.headless = headless
         self.timeout = timeout
         self.storage = DataStorage()
-        self.browser = None
+        self.playwright = None
+        self.browser = browser
+        self.owns_browser = browser is None
+        self.screenshot = screenshot
+        self.keep_raw = keep_raw
         self.context = None
         self.page = None
 
     async def initialize(self):
         """Initialize browser and page"""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=self.headless)
+        if self.screenshot:
+            self.SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
+
+        if self.owns_browser:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
         self.context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             # Ignore HTTPS errors for third-party scripts
             ignore_https_errors=True
         )
+
+        # Abort static assets and trackers for every page in this context
+        await self.context.route("**/*", self.block_requests)
         self.page = await self.context.new_page()
         
         # Suppress console errors from third-party scripts (analytics, tracking, etc.)
@@ -71,101 +128,94 @@ class ScraperAgent:
         
         self.page.on('console', handle_console)
         
-        # Suppress failed requests for third-party resources
-        async def handle_request_failed(request):
-            url = request.url.lower()
-            # Suppress failures for analytics, tracking, and other third-party scripts
-            ignore_patterns = [
-                'analytics', 'crazyegg', 'google-analytics', 'doubleclick', 
-                'googletagmanager', 'script.crazyegg', 'g/collect',
-                '.js', '.css', '.png', '.jpg', '.gif', '.svg',  # Static assets
-                'transportation.energy', 'assets/'  # NREL static assets
-            ]
-            if any(pattern in url for pattern in ignore_patterns):
-                return
-            # Only log API/data request failures that might be important
-            if 'api' in url or 'data' in url:
-                # Suppress these too as they're often expected to fail for some GeoIDs
-                return
-        
-        self.page.on('requestfailed', handle_request_failed)
-        
-        print(f"[Agent {self.agent_id}] Initialized")
+        logger.info(f"[Agent {self.agent_id}] Initialized")
+
+    @classmethod
+    async def block_requests(cls, route):
+        """
+        Route handler that aborts assets and trackers the scrape never reads
 
-    async def scrape_county(self, geoid):
+        Args:
+            route (Route): Intercepted Playwright route
+        """
+        request = route.request
+        url = request.url.lower()
+        if (request.resource_type in cls.BLOCKED_RESOURCE_TYPES
+                or any(pattern in url for pattern in cls.BLOCKED_URL_PATTERNS)):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def scrape_county(self, geoid, url=None):
         """
         Scrape data for a single county
 
         Args:
             geoid (str): County GeoID
+            url (str): Page to load; defaults to the county's Energy Snapshot
 
         Returns:
             dict: Scraped county data
         """
-        url = f"{self.BASE_URL}{geoid}"
-        print(f"[Agent {self.agent_id}] Scraping {geoid}...")
+        url = url or f"{self.BASE_URL}{geoid}"
+        logger.info(f"[Agent {self.agent_id}] Scraping {geoid}...")
 
         try:
             # Navigate to page and capture response
             # Use 'domcontentloaded' instead of 'networkidle' to avoid waiting for analytics/tracking scripts
             response = await self.page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
-            
-            # Wait for content to load and JavaScript to execute
-            # Give extra time for dynamic content to render
-            await asyncio.sleep(5)
-            
-            # Wait for main content elements to be visible
-            try:
-                # Wait for body to be ready
-                await self.page.wait_for_selector('body', timeout=5000)
-                # Try to wait for any main content indicators
-                await asyncio.sleep(2)
-            except:
-                pass  # Continue even if specific selectors aren't found
-            
+
             # Check HTTP status code
             if response:
                 status = response.status
                 if status == 404:
-                    print(f"[Agent {self.agent_id}] ✗ 404 Not Found for {geoid}")
-                    return self.create_error_record(geoid, "404 not found")
+                    logger.warning(f"[Agent {self.agent_id}] ✗ 404 Not Found for {geoid}")
+                    return self.create_error_record(geoid, "404 not found", url)
                 elif status >= 400:
-                    print(f"[Agent {self.agent_id}] ✗ HTTP {status} error for {geoid}")
-                    return self.create_error_record(geoid, f"HTTP {status} error")
-            
-            # Check page title - valid pages have county name in title, invalid ones don't
+                    logger.warning(f"[Agent {self.agent_id}] ✗ HTTP {status} error for {geoid}")
+                    return self.create_error_record(geoid, f"HTTP {status} error", url)
+
+            # Check page title first - valid pages have the county name in it, e.g.
+            # "Autauga County, AL Energy Snapshot...", while invalid GeoIDs only get
+            # "Energy Snapshot | State and Local Planning..."
             page_title = await self.page.title()
-            # Valid pages have format like "Autauga County, AL Energy Snapshot..."
-            # Invalid pages just have "Energy Snapshot | State and Local Planning..." (no county name)
-            if page_title:
-                # Invalid GeoID pages start with "Energy Snapshot |" 
-                # Valid pages have location name before "Energy Snapshot" (e.g., "County,", "Parish,", "Borough,")
-                # Check for patterns like "County," or "Parish," or "Borough," which indicate a valid location
-                if page_title.startswith('Energy Snapshot |'):
-                    # This is likely an invalid GeoID - no location name in title
-                    print(f"[Agent {self.agent_id}] ✗ 404 Not Found (no county in title) for {geoid}")
-                    return self.create_error_record(geoid, "404 not found - invalid GeoID")
+            if page_title.startswith(self.INVALID_TITLE_PREFIX):
+                # The app may still be replacing the generic title; give it a moment
+                # rather than waiting out the full metric timeout
+                try:
+                    await self.page.wait_for_function(
+                        "prefix => !document.title.startsWith(prefix)",
+                        arg=self.INVALID_TITLE_PREFIX, timeout=self.TITLE_TIMEOUT
+                    )
+                except PlaywrightTimeout:
+                    logger.warning(f"[Agent {self.agent_id}] ✗ 404 Not Found (no county in title) for {geoid}")
+                    return self.create_error_record(geoid, "404 not found - invalid GeoID", url)
+
+            # Proceed as soon as the metrics render instead of sleeping a fixed 7s
+            await self.page.wait_for_selector(self.METRIC_SELECTOR, state='attached',
+                                              timeout=self.METRIC_TIMEOUT)
 
             # Extract data from the page
-            data = await self.extract_data(geoid)
+            data = await self.extract_data(geoid, url)
 
-            print(f"[Agent {self.agent_id}] ✓ Scraped {geoid}")
+            logger.info(f"[Agent {self.agent_id}] ✓ Scraped {geoid}")
             return data
 
         except PlaywrightTimeout:
-            print(f"[Agent {self.agent_id}] ✗ Timeout for {geoid}")
-            return self.create_error_record(geoid, "timeout")
+            logger.warning(f"[Agent {self.agent_id}] ✗ Timeout for {geoid}")
+            return self.create_error_record(geoid, "timeout", url)
 
         except Exception as e:
-            print(f"[Agent {self.agent_id}] ✗ Error scraping {geoid}: {str(e)}")
-            return self.create_error_record(geoid, str(e))
+            logger.warning(f"[Agent {self.agent_id}] ✗ Error scraping {geoid}: {str(e)}")
+            return self.create_error_record(geoid, str(e), url)
 
-    async def extract_data(self, geoid):
+    async def extract_data(self, geoid, url=None):
         """
         Extract data from the loaded page
 
         Args:
             geoid (str): County GeoID
+            url (str): Page URL, if already built by the caller
 
         Returns:
             dict: Extracted data
@@ -173,63 +223,44 @@ class ScraperAgent:
         data = {
             "geoid": geoid,
             "timestamp": datetime.now().isoformat(),
-            "url": f"{self.BASE_URL}{geoid}",
+            "url": url or f"{self.BASE_URL}{geoid}",
             "agent_id": self.agent_id,
             "status": "success"
         }
 
         try:
-            # Extract page title
-            title = await self.page.title()
-            data["page_title"] = title
-
-            # Extract main content
-            # Wait for main content container
-            await self.page.wait_for_selector('body', timeout=5000)
-
-            # Get all text content
-            text_content = await self.page.evaluate('''() => {
-                return document.body.innerText;
-            }''')
-            data["page_content"] = text_content
-
-            # Try to extract structured data if available
-            # Look for common data patterns
-            try:
-                # Extract any visible metrics/statistics
-                stats = await self.page.evaluate('''() => {
-                    const stats = {};
-
-                    // Look for any data attributes or classes that might contain metrics
-                    const dataElements = document.querySelectorAll('[class*="metric"], [class*="stat"], [class*="value"]');
-                    dataElements.forEach((el, idx) => {
-                        stats[`metric_${idx}`] = el.innerText.trim();
-                    });
-
-                    return stats;
-                }''')
-                data["extracted_stats"] = stats
-            except:
-                data["extracted_stats"] = {}
+            # Title, text and visible metrics/statistics in one round-trip
+            # to the browser instead of one per field
+            page_data = await self.page.evaluate(
+                self.EXTRACT_SCRIPT, None if self.keep_raw else self.CONTENT_LIMIT
+            )
+            data["page_title"] = page_data["title"]
+            data["page_content"] = page_data["text"]
+            # Keys keep each element's position; empty elements are dropped
+            data["extracted_stats"] = {
+                f"metric_{idx}": value for idx, value in enumerate(page_data["stats"]) if value
+            }
 
             # Take screenshot for reference
-            screenshot_path = f"data/raw/screenshots/{geoid}.png"
-            Path("data/raw/screenshots").mkdir(parents=True, exist_ok=True)
-            await self.page.screenshot(path=screenshot_path)
-            data["screenshot"] = screenshot_path
+            if self.screenshot:
+                screenshot_path = f"{self.SCREENSHOT_DIR}/{geoid}.jpg"
+                await self.page.screenshot(path=screenshot_path, type='jpeg',
+                                           quality=self.SCREENSHOT_QUALITY)
+                data["screenshot"] = screenshot_path
 
         except Exception as e:
             data["extraction_error"] = str(e)
 
         return data
 
-    def create_error_record(self, geoid, error_msg):
+    def create_error_record(self, geoid, error_msg, url=None):
         """
         Create error record for failed scrape
 
         Args:
             geoid (str): County GeoID
             error_msg (str): Error message
+            url (str): Page URL, if already built by the caller
 
         Returns:
             dict: Error record
@@ -237,7 +268,7 @@ class ScraperAgent:
         return {
             "geoid": geoid,
             "timestamp": datetime.now().isoformat(),
-            "url": f"{self.BASE_URL}{geoid}",
+            "url": url or f"{self.BASE_URL}{geoid}",
             "agent_id": self.agent_id,
             "status": "error",
             "error": error_msg
@@ -260,12 +291,16 @@ class ScraperAgent:
             result = await self.scrape_county(geoid)
             results.append(result)
 
-            # Save immediately
-            self.storage.save_raw_data(geoid, result)
+            # Save in batches instead of one file write per county
+            if len(results) % self.FLUSH_EVERY == 0:
+                self.storage.save_raw_batch(results[-self.FLUSH_EVERY:])
 
             # Small delay between requests
             await asyncio.sleep(1)
 
+        if len(results) % self.FLUSH_EVERY:
+            self.storage.save_raw_batch(results[-(len(results) % self.FLUSH_EVERY):])
+
         await self.cleanup()
         return results
 
@@ -275,9 +310,13 @@ class ScraperAgent:
             await self.page.close()
         if self.context:
             await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        print(f"[Agent {self.agent_id}] Cleaned up")
+        # A shared browser is closed by whoever launched it
+        if self.owns_browser:
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+        logger.info(f"[Agent {self.agent_id}] Cleaned up")
 
 
 async def test_agent():
@@ -297,4 +336,5 @@ async def test_agent():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_agent())
+    setup_logging(console=True)
+    run_main(test_agent())
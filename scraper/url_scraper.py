@@ -4,77 +4,124 @@ Merges data from energy-snapshot and data-viewer pages
 """
 
 import asyncio
-import csv
+import json
 import sys
 from pathlib import Path
 from datetime import datetime
+import pandas as pd
 from tqdm import tqdm
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+import aiohttp
+
+try:
+    import httpx
+    import h2  # noqa: F401 - needed for httpx's http2=True
+    HAS_HTTP2 = True
+except ImportError:
+    # Optional: HTTP/2 multiplexing for --http mode (pip install "httpx[http2]")
+    HAS_HTTP2 = False
+
+try:
+    import floodr
+    HAS_FLOODR = True
+except ImportError:
+    # Optional: batched fetching on a Rust runtime for --http mode
+    HAS_FLOODR = False
 
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.data_storage import DataStorage
+from utils.data_storage import DataStorage, json_loads
+from utils.event_loop import run_main
+from scraper.browser_pool import BrowserPool
+from scraper.scraper_agent import ScraperAgent
 
 
 class URLBasedScraper:
     """Scrape counties from urls.csv"""
 
-    def __init__(self, urls_csv="urls.csv", num_agents=15):
+    # Page URL column and source name for each page scraped per county
+    SOURCES = (
+        ('url_energy_snapshot', 'energy-snapshot'),
+        ('url_data_viewer', 'data-viewer'),
+    )
+    # HTTP mode: discovered API URL templates and request concurrency
+    ENDPOINTS_FILE = "endpoints.json"
+    HTTP_CONCURRENCY = 50
+    HTTP_TIMEOUT = 10
+    # Counties per floodr call; results are recorded after each batch
+    HTTP_BATCH_SIZE = 500
+    # Same elements the stats extraction reads; present once data renders
+    DATA_SELECTOR = '[class*="metric"], [class*="stat"], [class*="value"]'
+    DATA_TIMEOUT = 8000
+    # Default page loads in flight across all agents (each agent has one
+    # page per source)
+    MAX_CONCURRENT_PAGES = 20
+    # Merged results are written to disk every FLUSH_EVERY counties
+    FLUSH_EVERY = 100
+
+    def __init__(self, urls_csv="urls.csv", num_agents=15, http=False, num_browsers=3,
+                 max_concurrency=MAX_CONCURRENT_PAGES):
         self.urls_csv = urls_csv
         self.num_agents = num_agents
+        self.http = http
+        self.num_browsers = num_browsers
+        self.max_concurrency = max_concurrency
         self.storage = DataStorage()
-        self.results = []
-        self.errors = []
+
+        # Shared by every agent so the limit is global, not per agent
+        self.page_slots = asyncio.Semaphore(max_concurrency)
+
+        # Merged results are streamed to this NDJSON file as they arrive;
+        # only the counters stay in memory
+        self.results_file = f"counties_data_merged_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+        self.pending = []
+        # Batch writes running in worker threads
+        self.writes = set()
+        self.total_scraped = 0
+        self.successful = 0
 
     def load_urls(self):
         """Load URLs from CSV"""
         print(f"Loading URLs from {self.urls_csv}...")
 
-        urls_data = []
-        with open(self.urls_csv, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                urls_data.append(row)
+        # Read everything as text so GeoIDs keep leading zeros and blank URLs stay ''
+        urls_data = pd.read_csv(
+            self.urls_csv, dtype=str, keep_default_na=False
+        ).to_dict('records')
 
         print(f"✓ Loaded {len(urls_data)} counties to scrape")
         return urls_data
 
-    async def scrape_url(self, browser, url, geoid, source_name):
-        """Scrape a single URL"""
-        context = await browser.new_context()
-        page = await context.new_page()
+    async def scrape_url(self, page, url, geoid, source_name):
+        """Scrape a single URL in an agent's reusable page"""
+        # Taken once, when the fetch starts, for the result whichever way it goes
+        timestamp = datetime.now().isoformat()
 
         try:
-            await page.goto(url, wait_until='networkidle', timeout=15000)
-            await asyncio.sleep(2)
+            # Only loading holds a slot; extraction runs locally in the page
+            async with self.page_slots:
+                # Wait for the data elements, not for analytics to go quiet
+                await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+                try:
+                    await page.wait_for_selector(self.DATA_SELECTOR, timeout=self.DATA_TIMEOUT)
+                except PlaywrightTimeout:
+                    pass  # Extract whatever rendered, as before
 
             # Extract data
             data = {
                 'geoid': geoid,
                 'url': url,
                 'source': source_name,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'status': 'success'
             }
 
-            # Get page title
-            data['page_title'] = await page.title()
-
-            # Get page content
-            data['page_content'] = await page.evaluate('() => document.body.innerText')
-
-            # Try to extract metrics
-            try:
-                stats = await page.evaluate('''() => {
-                    const stats = {};
-                    const dataElements = document.querySelectorAll('[class*="metric"], [class*="stat"], [class*="value"]');
-                    dataElements.forEach((el, idx) => {
-                        stats[`metric_${idx}`] = el.innerText.trim();
-                    });
-                    return stats;
-                }''')
-                data['extracted_stats'] = stats
-            except:
-                data['extracted_stats'] = {}
+            # Title, text and metrics in one evaluate, scoped to the main content
+            page_data = await page.evaluate(ScraperAgent.EXTRACT_SCRIPT)
+            data['page_title'] = page_data['title']
+            data['page_content'] = page_data['text']
+            data['extracted_stats'] = {
+                f"metric_{idx}": value for idx, value in enumerate(page_data['stats']) if value
+            }
 
             return data
 
@@ -83,67 +130,315 @@ class URLBasedScraper:
                 'geoid': geoid,
                 'url': url,
                 'source': source_name,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'status': 'error',
                 'error': str(e)
             }
 
-        finally:
-            await page.close()
-            await context.close()
+    async def discover_endpoints(self, url, geoid):
+        """
+        Load one page in a browser and record the API calls behind it
+
+        Args:
+            url (str): Page URL for a sample county
+            geoid (str): GeoID contained in that URL
 
-    async def scrape_county_urls(self, agent_id, county_data_list, pbar=None):
-        """Scrape both URLs for each county"""
+        Returns:
+            list: XHR/fetch URL templates with the GeoID replaced by {geoid}
+        """
         playwright = await async_playwright().start()
         browser = await playwright.chromium.launch(headless=True)
-        results = []
+        requests = set()
 
         try:
-            for county_data in county_data_list:
-                geoid = county_data['geoid']
-                url1 = county_data.get('url_energy_snapshot', '')
-                url2 = county_data.get('url_data_viewer', '')
+            page = await browser.new_page()
 
-                # Scrape energy snapshot
-                if url1:
-                    result1 = await self.scrape_url(browser, url1, geoid, 'energy-snapshot')
-                    await asyncio.sleep(0.5)
-                else:
-                    result1 = {'geoid': geoid, 'status': 'skipped', 'source': 'energy-snapshot'}
+            def record_request(request):
+                if request.resource_type in ('xhr', 'fetch') and geoid in request.url:
+                    requests.add(request.url)
 
-                # Scrape data viewer
-                if url2:
-                    result2 = await self.scrape_url(browser, url2, geoid, 'data-viewer')
-                    await asyncio.sleep(0.5)
-                else:
-                    result2 = {'geoid': geoid, 'status': 'skipped', 'source': 'data-viewer'}
+            page.on('request', record_request)
+
+            # One-off load, so waiting for the network to settle is fine here
+            await page.goto(url, wait_until='networkidle', timeout=30000)
+
+        finally:
+            await browser.close()
+            await playwright.stop()
+
+        return sorted(request.replace(geoid, '{geoid}') for request in requests)
+
+    async def load_endpoints(self, sample):
+        """
+        Load saved API endpoint templates, discovering them if needed
+
+        Args:
+            sample (dict): A urls.csv row used for discovery
+
+        Returns:
+            dict: Endpoint templates by source name
+        """
+        endpoints_file = self.storage.base_dir / self.ENDPOINTS_FILE
+        if endpoints_file.exists():
+            print(f"✓ Using API endpoints from {endpoints_file}")
+            with open(endpoints_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        print(f"Discovering API endpoints from {sample['geoid']}...")
+        endpoints = {}
+        for column, source_name in self.SOURCES:
+            if sample.get(column):
+                endpoints[source_name] = await self.discover_endpoints(sample[column], sample['geoid'])
 
-                # Merge both results
-                merged_result = self.merge_results(geoid, result1, result2)
-                results.append(merged_result)
+        with open(endpoints_file, 'w', encoding='utf-8') as f:
+            json.dump(endpoints, f, indent=2)
+        print(f"✓ Saved API endpoints to {endpoints_file}")
 
-                # Save immediately
-                self.storage.save_raw_data(geoid, merged_result)
+        return endpoints
+
+    async def fetch_endpoints(self, session, semaphore, templates, geoid, source_name):
+        """Fetch the API responses behind one page over plain HTTP"""
+        data = {
+            'geoid': geoid,
+            'source': source_name,
+            'timestamp': datetime.now().isoformat(),
+            'status': 'success'
+        }
+
+        try:
+            api_data = {}
+            async with semaphore:
+                for template in templates:
+                    url = template.replace('{geoid}', geoid)
+                    api_data[url] = await self.fetch_json(session, url)
+
+            data['url'] = templates[0].replace('{geoid}', geoid)
+            data['api_data'] = api_data
+            return data
+
+        except Exception as e:
+            data['status'] = 'error'
+            data['error'] = str(e)
+            return data
+
+    async def fetch_json(self, session, url):
+        """GET a URL and decode its JSON body with the session's client library"""
+        if HAS_HTTP2:
+            response = await session.get(url)
+            response.raise_for_status()
+            return response.json()
+
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.HTTP_TIMEOUT)) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def scrape_county_http(self, session, semaphore, endpoints, county_data, pbar=None):
+        """Fetch both sources for one county without a browser"""
+        geoid = county_data['geoid']
+
+        async def fetch_source(column, source_name):
+            if not county_data.get(column):
+                return {'geoid': geoid, 'status': 'skipped', 'source': source_name}
+            return await self.fetch_endpoints(session, semaphore, endpoints[source_name], geoid, source_name)
+
+        # Both pages of a county are fetched concurrently
+        result1, result2 = await asyncio.gather(*(
+            fetch_source(column, source_name) for column, source_name in self.SOURCES
+        ))
+
+        self.record_result(self.merge_results(geoid, result1, result2))
+
+        if pbar:
+            pbar.update(1)
+
+    def http_session(self):
+        """
+        Create the pooled HTTP client for --http mode
+
+        Uses an HTTP/2 httpx client when available, so requests to one host
+        share a single multiplexed connection; aiohttp otherwise.
+
+        Returns:
+            httpx.AsyncClient or aiohttp.ClientSession: Client (an async context manager)
+        """
+        if HAS_HTTP2:
+            limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            return httpx.AsyncClient(http2=True, limits=limits, timeout=self.HTTP_TIMEOUT)
+
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300)
+        return aiohttp.ClientSession(connector=connector)
+
+    async def scrape_all_batched(self, urls_data, endpoints, pbar=None):
+        """
+        Fetch counties in large batches executed by floodr
+
+        Connection pooling, TLS and scheduling run in floodr's Rust runtime,
+        so Python only builds the batch and decodes the JSON bodies.
+
+        Args:
+            urls_data (list): urls.csv rows
+            endpoints (dict): Endpoint templates by source name
+            pbar (tqdm): Progress bar
+        """
+        for offset in range(0, len(urls_data), self.HTTP_BATCH_SIZE):
+            batch = urls_data[offset:offset + self.HTTP_BATCH_SIZE]
+            jobs = [
+                (county_data['geoid'], source_name, template.replace('{geoid}', county_data['geoid']))
+                for county_data in batch
+                for column, source_name in self.SOURCES if county_data.get(column)
+                for template in endpoints[source_name]
+            ]
+
+            responses = await floodr.request(
+                [floodr.Request(url=url, timeout=self.HTTP_TIMEOUT) for _, _, url in jobs],
+                max_concurrent=self.HTTP_CONCURRENCY
+            )
+
+            # The whole batch was fetched together, so it shares one timestamp
+            timestamp = datetime.now().isoformat()
+
+            # Collect each county/source's responses; the first failure wins
+            api_data = {}
+            errors = {}
+            for (geoid, source_name, url), response in zip(jobs, responses):
+                key = (geoid, source_name)
+                try:
+                    if response.error:
+                        raise RuntimeError(response.error)
+                    if response.status_code >= 400:
+                        raise RuntimeError(f"HTTP {response.status_code} error for url '{url}'")
+                    api_data.setdefault(key, {})[url] = json_loads(response.content)
+                except Exception as e:
+                    errors.setdefault(key, str(e))
+
+            for county_data in batch:
+                geoid = county_data['geoid']
+                results = []
+                for column, source_name in self.SOURCES:
+                    key = (geoid, source_name)
+                    if not county_data.get(column):
+                        results.append({'geoid': geoid, 'status': 'skipped', 'source': source_name})
+                        continue
+
+                    result = {
+                        'geoid': geoid,
+                        'url': endpoints[source_name][0].replace('{geoid}', geoid),
+                        'source': source_name,
+                        'timestamp': timestamp,
+                        'status': 'success'
+                    }
+                    if key in errors:
+                        result['status'] = 'error'
+                        result['error'] = errors[key]
+                    else:
+                        result['api_data'] = api_data[key]
+                    results.append(result)
+
+                self.record_result(self.merge_results(geoid, *results))
 
                 if pbar:
                     pbar.update(1)
 
-                await asyncio.sleep(0.5)
+    async def scrape_all_http(self, urls_data, endpoints, pbar=None):
+        """Fetch every county over one pooled HTTP session"""
+        if HAS_FLOODR:
+            return await self.scrape_all_batched(urls_data, endpoints, pbar)
+
+        semaphore = asyncio.Semaphore(self.HTTP_CONCURRENCY)
+
+        async with self.http_session() as session:
+            await asyncio.gather(*(
+                self.scrape_county_http(session, semaphore, endpoints, county_data, pbar)
+                for county_data in urls_data
+            ))
+
+    async def scrape_source(self, page, county_data, column, source_name):
+        """Scrape one of a county's URLs, or mark it skipped if it has none"""
+        geoid = county_data['geoid']
+        url = county_data.get(column, '')
+        if not url:
+            return {'geoid': geoid, 'status': 'skipped', 'source': source_name}
+
+        return await self.scrape_url(page, url, geoid, source_name)
+
+    async def scrape_county_urls(self, agent_id, pool, queue, pbar=None):
+        """Scrape both URLs for counties pulled from the shared queue"""
+        # One context per agent with a page per source, reused for every county
+        context = await pool.new_context()
+        await context.route("**/*", ScraperAgent.block_requests)
+        pages = [await context.new_page() for _ in self.SOURCES]
+
+        try:
+            # Every agent pulls from one queue until it is drained, so agents
+            # that hit fast (e.g. missing) counties take work from slow ones.
+            # Nothing awaits between empty() and get_nowait(), so no race.
+            while not queue.empty():
+                county_data = queue.get_nowait()
+                geoid = county_data['geoid']
+
+                urls = [county_data.get(column) for column, _ in self.SOURCES]
+                if urls[0] and urls[0] == urls[1]:
+                    # Both columns point at the same page; load it once
+                    result1 = await self.scrape_source(pages[0], county_data, *self.SOURCES[0])
+                    result2 = {**result1, 'source': self.SOURCES[1][1]}
+                else:
+                    # The two pages are independent, so load them side by side
+                    result1, result2 = await asyncio.gather(*(
+                        self.scrape_source(page, county_data, column, source_name)
+                        for page, (column, source_name) in zip(pages, self.SOURCES)
+                    ))
+
+                # Merge both results and save immediately
+                self.record_result(self.merge_results(geoid, result1, result2))
+
+                if pbar:
+                    pbar.update(1)
 
         except Exception as e:
             print(f"\n[Agent {agent_id}] Error: {e}")
 
         finally:
-            await browser.close()
-            await playwright.stop()
-
-        return results
+            for page in pages:
+                await page.close()
+            await pool.close_context(context)
+
+    def record_result(self, merged_result):
+        """Buffer one merged county result and update the counters"""
+        self.pending.append(merged_result)
+        if len(self.pending) >= self.FLUSH_EVERY:
+            self.flush_results()
+
+        self.total_scraped += 1
+        if merged_result['status'] == 'success':
+            self.successful += 1
+
+    def flush_results(self):
+        """Hand buffered results to a worker thread for writing"""
+        if self.pending:
+            # Serializing, compressing and writing a batch would otherwise
+            # stall every agent on the event loop
+            write = asyncio.ensure_future(asyncio.to_thread(self.write_results, self.pending))
+            self.writes.add(write)
+            write.add_done_callback(self.writes.discard)
+            self.pending = []
+
+    def write_results(self, batch):
+        """Write results to the raw files and the NDJSON stream"""
+        self.storage.save_raw_batch(batch)
+        self.storage.append_ndjson(batch, self.results_file)
+
+    async def drain_results(self):
+        """Flush the buffer and wait for every pending write"""
+        self.flush_results()
+        await asyncio.gather(*self.writes)
 
     def merge_results(self, geoid, result1, result2):
         """Merge data from both URLs"""
         merged = {
             'geoid': geoid,
-            'timestamp': datetime.now().isoformat(),
+            # Reuse the fetch time so the merged record matches its sources
+            'timestamp': (result1.get('timestamp') or result2.get('timestamp')
+                          or datetime.now().isoformat()),
             'status': 'success' if (result1.get('status') == 'success' or result2.get('status') == 'success') else 'error'
         }
 
@@ -152,12 +447,16 @@ class URLBasedScraper:
             merged['energy_snapshot_title'] = result1.get('page_title', '')
             merged['energy_snapshot_content'] = result1.get('page_content', '')
             merged['energy_snapshot_stats'] = result1.get('extracted_stats', {})
+            if 'api_data' in result1:
+                merged['energy_snapshot_api'] = result1['api_data']
 
         # Add data viewer data
         if result2.get('status') == 'success':
             merged['data_viewer_title'] = result2.get('page_title', '')
             merged['data_viewer_content'] = result2.get('page_content', '')
             merged['data_viewer_stats'] = result2.get('extracted_stats', {})
+            if 'api_data' in result2:
+                merged['data_viewer_api'] = result2['api_data']
 
         # Add source URLs
         merged['sources'] = {
@@ -183,55 +482,94 @@ class URLBasedScraper:
         urls_data = self.load_urls()
         total = len(urls_data)
 
-        # Split work among agents
-        chunk_size = total // self.num_agents
-        agent_chunks = []
+        if self.http and urls_data:
+            endpoints = await self.load_endpoints(urls_data[0])
+
+            # Every source needs endpoints, or its data would silently go missing
+            if all(endpoints.get(source_name) for _, source_name in self.SOURCES):
+                return await self.run_http(urls_data, endpoints)
 
-        for i in range(self.num_agents):
-            start_idx = i * chunk_size
-            if i == self.num_agents - 1:
-                end_idx = total
-            else:
-                end_idx = start_idx + chunk_size
+            print("⚠️  No API endpoints found for every page, falling back to the browser")
 
-            agent_chunks.append(urls_data[start_idx:end_idx])
+        # Agents share one work queue instead of fixed, equal-sized chunks
+        queue = asyncio.Queue()
+        for county_data in urls_data:
+            queue.put_nowait(county_data)
 
-        print(f"\nScraping {total} counties with {self.num_agents} agents")
+        print(f"\nScraping {total} counties with {self.num_agents} agents "
+              f"sharing {self.num_browsers} browsers ({self.max_concurrency} pages loading at once)")
         print(f"{'='*70}\n")
 
         # Create tasks
         tasks = []
         pbar = tqdm(total=total, desc="Scraping", unit="county")
 
-        for i, chunk in enumerate(agent_chunks, 1):
-            task = self.scrape_county_urls(i, chunk, pbar)
+        # Agents open their contexts on a few shared browsers
+        pool = BrowserPool(size=self.num_browsers)
+        await pool.start()
+
+        for i in range(1, self.num_agents + 1):
+            task = self.scrape_county_urls(i, pool, queue, pbar)
             tasks.append(task)
 
         # Run all agents
         start_time = datetime.now()
-        all_results = await asyncio.gather(*tasks)
-
-        # Flatten results
-        for agent_results in all_results:
-            self.results.extend(agent_results)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await pool.close()
 
         pbar.close()
 
         # Stats
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
-        successful = sum(1 for r in self.results if r.get('status') == 'success')
 
         print(f"\n{'='*70}")
-        print(f"Scraped: {len(self.results)} counties in {duration:.1f}s")
-        print(f"Successful: {successful} ({successful/len(self.results)*100:.1f}%)")
+        print(f"Scraped: {self.total_scraped} counties in {duration:.1f}s")
+        print(f"Successful: {self.successful} ({self.successful/max(self.total_scraped, 1)*100:.1f}%)")
         print(f"{'='*70}\n")
 
-        # Save
-        self.storage.save_to_csv(self.results, "counties_data_merged.csv")
-        self.storage.save_batch_data(self.results, "counties_data_merged.json")
+        await self.drain_results()
+        return self.save_results()
+
+    async def run_http(self, urls_data, endpoints):
+        """Run scraping against the discovered API endpoints"""
+        total = len(urls_data)
+        protocol = "floodr" if HAS_FLOODR else "HTTP/2" if HAS_HTTP2 else "HTTP/1.1"
+        print(f"\nFetching {total} counties over {protocol} ({self.HTTP_CONCURRENCY} concurrent)")
+        print(f"{'='*70}\n")
+
+        pbar = tqdm(total=total, desc="Fetching", unit="county")
+        start_time = datetime.now()
+        await self.scrape_all_http(urls_data, endpoints, pbar)
+        pbar.close()
+
+        duration = (datetime.now() - start_time).total_seconds()
 
-        return self.results
+        print(f"\n{'='*70}")
+        print(f"Fetched: {self.total_scraped} counties in {duration:.1f}s")
+        print(f"Successful: {self.successful} ({self.successful/max(self.total_scraped, 1)*100:.1f}%)")
+        print(f"{'='*70}\n")
+
+        await self.drain_results()
+        return self.save_results()
+
+    def save_results(self):
+        """
+        Convert the streamed NDJSON results into every output format
+
+        Call after drain_results so every buffered write has landed.
+
+        Returns:
+            list: Merged county results
+        """
+        results = self.storage.load_ndjson(self.results_file)
+
+        self.storage.save_to_csv(results, "counties_data_merged.csv")
+        self.storage.save_to_parquet(results, "counties_data_merged.parquet")
+        self.storage.save_batch_data(results, "counties_data_merged.json")
+        return results
 
 
 async def main():
@@ -241,6 +579,19 @@ async def main():
     parser = argparse.ArgumentParser(description="Scrape from urls.csv")
     parser.add_argument("--urls", default="urls.csv", help="Path to urls.csv")
     parser.add_argument("--agents", type=int, default=15, help="Number of agents")
+    parser.add_argument("--browsers", type=int, default=3, help="Browsers shared by the agents")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=URLBasedScraper.MAX_CONCURRENT_PAGES,
+        help=f"Page loads in flight across all agents (default: {URLBasedScraper.MAX_CONCURRENT_PAGES})"
+    )
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        help=f"Fetch the pages' API endpoints directly instead of rendering each page "
+             f"(discovered once and saved to data/{URLBasedScraper.ENDPOINTS_FILE})"
+    )
 
     args = parser.parse_args()
 
@@ -250,16 +601,17 @@ async def main():
         print("  python generate_urls.py")
         return 1
 
-    scraper = URLBasedScraper(urls_csv=args.urls, num_agents=args.agents)
+    scraper = URLBasedScraper(urls_csv=args.urls, num_agents=args.agents, http=args.http,
+                             num_browsers=args.browsers, max_concurrency=args.concurrency)
     await scraper.run()
 
     print("\n✓ Done! Data saved to:")
     print("  - data/processed/counties_data_merged.csv")
-    print("  - data/processed/counties_data_merged.json")
+    print("  - data/processed/counties_data_merged.feather (.json without pyarrow)")
 
     return 0
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run_main(main())
     sys.exit(exit_code)
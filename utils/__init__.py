@@ -2,5 +2,7 @@
 
 from .geoid_generator import GeoIDGenerator
 from .data_storage import DataStorage
+from .rate_limiter import RateLimiter
+from .log_setup import setup_logging
 
-__all__ = ['GeoIDGenerator', 'DataStorage']
+__all__ = ['GeoIDGenerator', 'DataStorage', 'RateLimiter', 'setup_logging']
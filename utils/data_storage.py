@@ -3,25 +3,229 @@ Data Storage Utility
 Handles saving and loading of scraped county data
 """
 
+import base64
+import gzip
 import json
-import csv
 import os
-from datetime import datetime
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    HAS_PYARROW = True
+except ImportError:
+    # Optional: enables multi-threaded CSV parsing, Parquet and Arrow IPC files
+    HAS_PYARROW = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    # Optional: faster serialization of raw per-county records
+    HAS_ORJSON = False
+
+
+# Page text fields stored gzip-compressed (base64 text) in raw files; a
+# "<field>_gz" flag marks each compressed value
+COMPRESSED_FIELDS = ('page_content', 'energy_snapshot_content', 'data_viewer_content')
+
+
+if HAS_ORJSON:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+    # error handling is the same either way
+    json_loads = orjson.loads
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+else:
+    json_loads = json.loads
+
+
+def _json_default(value):
+    """Encode values json can't, the way orjson does (else via str)"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_keys(value):
+    """Copy dicts with key types json rejects under string keys, as orjson does"""
+    if isinstance(value, dict):
+        return {
+            k if isinstance(k, (str, int, float, bool)) or k is None else _json_default(k): _json_keys(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_json_keys(v) for v in value]
+    return value
+
+
+def json_dumps_bytes(value):
+    """Encode a value as compact UTF-8 JSON, with orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS)
+
+    try:
+        text = json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=_json_default)
+    except TypeError:
+        # Only walk the value when a key needs converting
+        text = json.dumps(_json_keys(value), separators=(',', ':'), ensure_ascii=False, default=_json_default)
+    return text.encode('utf-8')
+
+
+def json_dumps(value):
+    """Encode a value as compact JSON text, with orjson when available"""
+    return json_dumps_bytes(value).decode('utf-8')
+
+
+def _scan_files(directory, suffixes):
+    """
+    List the files in a flat directory with the given suffixes
+
+    Cheaper than Path.glob: no pattern is compiled, and is_file() uses the
+    dirent type so regular files are never stat'ed. Dotfiles are skipped,
+    as glob does.
+
+    Args:
+        directory (Path): Directory to list
+        suffixes (tuple): File name suffixes to keep (e.g. ('.json',))
+
+    Returns:
+        list: os.DirEntry objects of the matching files
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.endswith(suffixes) and not entry.name.startswith(".") and entry.is_file()
+        ]
+
+
+def _read_json(filepath):
+    """Parse a JSON file, with orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(Path(filepath).read_bytes())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _encode_nested(df):
+    """
+    JSON-encode dict/list values in place so the frame fits a flat schema
+
+    Returns:
+        list: Names of the encoded columns
+    """
+    nested = []
+    for col in df.columns[df.dtypes == object]:
+        if df[col].map(lambda v: isinstance(v, (dict, list))).any():
+            df[col] = df[col].map(
+                lambda v: json_dumps(v) if isinstance(v, (dict, list)) else v
+            )
+            nested.append(col)
+    return nested
+
+
+# Value types Arrow stores natively (nullable); any other column, or one
+# mixing these, is stored as JSON text
+_ARROW_SCALARS = (str, int, float, bool)
+
+
+def _feather_table(records):
+    """
+    Build an Arrow table of record dicts that _read_feather_records inverts
+
+    Columns with a single scalar type keep their Arrow type (nulls stay
+    nulls, so ints with gaps stay ints); the rest are stored as JSON text.
+    Which keys each record lacked is kept in the schema metadata, so
+    missing keys and explicit None values both survive.
+    """
+    columns = dict.fromkeys(key for record in records for key in record)
+
+    arrays, json_columns, absent = {}, [], {}
+    for col in columns:
+        values = [record.get(col) for record in records]
+        missing = [i for i, record in enumerate(records) if col not in record]
+        if missing:
+            absent[col] = missing
+
+        types = {type(v) for v in values if v is not None}
+        if len(types) > 1 or not types <= set(_ARROW_SCALARS):
+            values = [None if v is None else json_dumps(v) for v in values]
+            json_columns.append(col)
+        arrays[col] = pa.array(values)
+
+    table = pa.table(arrays) if arrays else pa.table({})
+    return table.replace_schema_metadata({
+        b'json_columns': json_dumps_bytes(json_columns),
+        b'absent_keys': json_dumps_bytes(absent),
+    })
+
+
+def _read_feather_records(filepath):
+    """Load a save_batch_data Feather file back into record dicts"""
+    table = feather.read_table(filepath)
+    metadata = table.schema.metadata or {}
+    json_columns = set(json_loads(metadata.get(b'json_columns', b'[]')))
+    absent = {col: set(rows) for col, rows in json_loads(metadata.get(b'absent_keys', b'{}')).items()}
+
+    columns = table.to_pydict()
+    for col in json_columns:
+        columns[col] = [None if v is None else json_loads(v) for v in columns[col]]
+
+    return [
+        {col: values[i] for col, values in columns.items() if i not in absent.get(col, ())}
+        for i in range(table.num_rows)
+    ]
+
+
+def _compress_text_fields(data):
+    """Return a copy of a record with its page text fields gzip-compressed"""
+    data = dict(data)
+    for field in COMPRESSED_FIELDS:
+        if isinstance(data.get(field), str) and not data.get(f"{field}_gz"):
+            packed = gzip.compress(data[field].encode('utf-8'), compresslevel=6)
+            data[field] = base64.b64encode(packed).decode('ascii')
+            data[f"{field}_gz"] = True
+    return data
+
+
+def _decompress_text_fields(data):
+    """Undo _compress_text_fields in place; uncompressed records pass through"""
+    for field in COMPRESSED_FIELDS:
+        if data.pop(f"{field}_gz", False):
+            data[field] = gzip.decompress(base64.b64decode(data[field])).decode('utf-8')
+    return data
+
 
 class DataStorage:
     """Manage storage of scraped county energy data"""
 
-    def __init__(self, base_dir="data"):
+    # Threads reading raw files in merge_and_deduplicate
+    READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+    def __init__(self, base_dir="data", compress_text=True, default_format=None):
         """
         Initialize data storage
 
         Args:
             base_dir (str): Base directory for data storage
+            compress_text (bool): Gzip page text fields in raw files
+            default_format (str): save_batch_data format, 'feather' or 'json'
+                (default: 'feather' when pyarrow is installed)
         """
         self.base_dir = Path(base_dir)
+        self.compress_text = compress_text
+        self.default_format = default_format or ("feather" if HAS_PYARROW else "json")
         self.raw_dir = self.base_dir / "raw"
         self.processed_dir = self.base_dir / "processed"
 
@@ -29,6 +233,21 @@ class DataStorage:
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.processed_dir.mkdir(parents=True, exist_ok=True)
 
+        # Serializes appends to shared NDJSON files
+        self._append_lock = threading.Lock()
+
+        # Raw records by GeoID, built on first use. Our own saves add to it
+        # directly; other processes' files are picked up by raw_index when
+        # the directory's mtime changes
+        self._raw_index = None
+        self._raw_names = set()
+        self._raw_mtime = None
+        self._raw_racy = True
+
+        # Records of the batch files last loaded, reused while a file's
+        # mtime and size are unchanged
+        self._batch_cache = {}
+
     def save_raw_data(self, geoid, data, format="json"):
         """
         Save raw scraped data for a county
@@ -37,34 +256,172 @@ class DataStorage:
             geoid (str): County GeoID
             data (dict): Scraped data
             format (str): Storage format ('json' or 'csv')
+
+        Returns:
+            Path: Path to the written file
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # Page text is most of each record and compresses well
+        if self.compress_text:
+            data = _compress_text_fields(data)
+
         if format == "json":
             filepath = self.raw_dir / f"{geoid}_{timestamp}.json"
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps_bytes(data))
         elif format == "csv":
             filepath = self.raw_dir / f"{geoid}_{timestamp}.csv"
             df = pd.DataFrame([data])
             df.to_csv(filepath, index=False)
 
+        # A second save within the same second overwrites the same file
+        if format == "json" and self._raw_index is not None and filepath.name not in self._raw_names:
+            self._raw_names.add(filepath.name)
+            self._raw_index.setdefault(geoid, []).append((timestamp, filepath, None))
+
         return filepath
 
-    def save_batch_data(self, batch_data, filename="batch_data.json"):
+    def save_raw_batch(self, records, format="json"):
+        """
+        Save raw scraped data for several counties in one call
+
+        Meant to be run off the event loop (e.g. via asyncio.to_thread) so
+        scrapers hand over a whole batch of writes at once. JSON batches go
+        to a single "raw_batch_{timestamp}_{id}.ndjson" segment, one record
+        per line, instead of a file per county; a ".idx" sidecar records
+        each line's GeoID and byte offset so single records can be read
+        back with a seek.
+
+        Args:
+            records (list): Scraped data dicts, each with a 'geoid' key
+            format (str): Storage format ('json' or 'csv')
+
+        Returns:
+            list: Paths of the saved files
+        """
+        if format != "json":
+            return [self.save_raw_data(r['geoid'], r, format=format) for r in records]
+        if not records:
+            return []
+
+        # Microseconds keep segments ordered after same-second JSON files
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filepath = self.raw_dir / f"raw_batch_{timestamp}_{uuid.uuid4().hex[:6]}.ndjson"
+
+        lines, offsets = [], []
+        position = 0
+        for record in records:
+            if self.compress_text:
+                record = _compress_text_fields(record)
+            line = json_dumps_bytes(record) + b"\n"
+            offsets.append(position)
+            position += len(line)
+            lines.append(line)
+
+        # Both files are written under temporary names and the segment is
+        # renamed into place last, so a raw_index in another process only
+        # ever lists complete segments that already have their index
+        geoids = [r['geoid'] for r in records]
+        index_file = filepath.with_suffix(".idx")
+        tmp_index = index_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_index.write_bytes(json_dumps_bytes({"timestamp": timestamp, "geoids": geoids, "offsets": offsets}))
+        os.replace(tmp_index, index_file)
+
+        tmp_file = filepath.with_suffix(f".ndjson.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(b"".join(lines))
+        os.replace(tmp_file, filepath)
+
+        if self._raw_index is not None:
+            self._raw_names.add(filepath.name)
+            for geoid, offset in zip(geoids, offsets):
+                self._raw_index.setdefault(geoid, []).append((timestamp, filepath, offset))
+
+        return [filepath]
+
+    def save_batch_data(self, batch_data, filename="batch_data.json", format=None):
         """
         Save batch of county data
 
+        Feather output is zstd-compressed and columnar, so it is several
+        times smaller and faster to load than JSON. Its suffix replaces the
+        one in filename; load_all_data reads the records back unchanged.
+
         Args:
             batch_data (list): List of county data dictionaries
             filename (str): Output filename
+            format (str): 'feather' or 'json' (default: self.default_format)
+
+        Returns:
+            Path: Path to saved file
         """
+        if (format or self.default_format) == "feather" and HAS_PYARROW:
+            filepath = self.processed_dir / Path(filename).with_suffix(".feather").name
+
+            try:
+                table = _feather_table(batch_data)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError) as e:
+                # E.g. integers beyond int64; keep the data as JSON
+                print(f"⚠️  Cannot store {filename} as Feather ({e}), writing JSON")
+            else:
+                feather.write_feather(table, filepath, compression="zstd")
+                return filepath
+
         filepath = self.processed_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(batch_data, f, indent=2, ensure_ascii=False)
+
+        # Still one JSON array, but encoded a record at a time: only one
+        # record's text is held at once, and each goes through the C encoder
+        # (json.dump to a file falls back to the pure-Python one)
+        with open(filepath, 'wb') as f:
+            f.write(b'[')
+            for i, record in enumerate(batch_data):
+                f.write(b',\n' if i else b'\n')
+                f.write(json_dumps_bytes(record))
+            f.write(b'\n]')
 
         return filepath
 
+    def append_ndjson(self, records, filename="partial_results.ndjson"):
+        """
+        Append records to a newline-delimited JSON file
+
+        Lets long scrapes flush results as they go, so memory stays flat
+        and a crash keeps everything written so far.
+
+        Args:
+            records (list): List of county data dictionaries
+            filename (str): Output filename
+
+        Returns:
+            Path: Path to the file
+        """
+        filepath = self.processed_dir / filename
+        lines = b"".join(json_dumps_bytes(r) + b"\n" for r in records)
+
+        with self._append_lock:
+            with open(filepath, 'ab') as f:
+                f.write(lines)
+
+        return filepath
+
+    def load_ndjson(self, filename="partial_results.ndjson"):
+        """
+        Load records from a newline-delimited JSON file
+
+        Args:
+            filename (str): NDJSON filename
+
+        Returns:
+            list: List of county data dictionaries (empty if the file is missing)
+        """
+        filepath = self.processed_dir / filename
+        if not filepath.exists():
+            return []
+
+        with open(filepath, 'rb') as f:
+            return [json_loads(line) for line in f if line.strip()]
+
     def save_to_csv(self, data, filename="counties_data.csv"):
         """
         Save data to CSV file
@@ -86,6 +443,185 @@ class DataStorage:
 
         return filepath
 
+    def save_to_parquet(self, data, filename="counties_data.parquet"):
+        """
+        Save data to a Parquet file (requires pyarrow)
+
+        Nested values (dicts/lists) are stored as JSON strings.
+
+        Args:
+            data (list or pd.DataFrame): County data
+            filename (str): Output filename
+
+        Returns:
+            Path: Path to saved file, or None if pyarrow is not installed
+        """
+        if not HAS_PYARROW:
+            return None
+
+        filepath = self.processed_dir / filename
+        df = data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        _encode_nested(df)
+
+        df.to_parquet(filepath, index=False, compression="zstd")
+        return filepath
+
+    def load_table(self, filepath):
+        """
+        Load a tabular data file (Parquet or CSV)
+
+        Uses pyarrow's multi-threaded readers when available.
+
+        Args:
+            filepath (str or Path): Path to a .parquet or .csv file
+
+        Returns:
+            pd.DataFrame: Loaded data
+        """
+        filepath = Path(filepath)
+        if filepath.suffix == ".parquet":
+            return pd.read_parquet(filepath)
+        if HAS_PYARROW:
+            return pd.read_csv(filepath, engine="pyarrow")
+        return pd.read_csv(filepath)
+
+    def load_shared_table(self, filepath):
+        """
+        Load a tabular file through a memory-mapped Arrow IPC cache
+
+        The first load writes an uncompressed Arrow IPC (Feather v2) copy to
+        ``processed/cache``, named by a fingerprint of the source path, size
+        and mtime. Later loads, from any process, memory-map that copy
+        instead of re-parsing the source, so dashboards on one host share
+        the OS page cache. Falls back to load_table without pyarrow.
+
+        Args:
+            filepath (str or Path): Path to a .parquet or .csv file
+
+        Returns:
+            pd.DataFrame: Loaded data
+        """
+        filepath = Path(filepath)
+        if not HAS_PYARROW:
+            return self.load_table(filepath)
+
+        stat = filepath.stat()
+        key = f"{filepath.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        fingerprint = hashlib.sha1(key.encode()).hexdigest()[:12]
+
+        cache_dir = self.processed_dir / "cache"
+        cache_file = cache_dir / f"{filepath.stem}.{fingerprint}.arrow"
+
+        if not cache_file.exists():
+            df = self.load_table(filepath)
+            cache_dir.mkdir(exist_ok=True)
+
+            # Drop caches of older versions of this file
+            for stale in cache_dir.glob(f"{filepath.stem}.*.arrow"):
+                stale.unlink(missing_ok=True)
+
+            # Write then rename so concurrent readers never see a partial file
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            feather.write_feather(df, tmp_file, compression="uncompressed")
+            os.replace(tmp_file, cache_file)
+            return df
+
+        return feather.read_table(cache_file, memory_map=True).to_pandas()
+
+    def raw_index(self):
+        """
+        Map each GeoID to its raw records
+
+        The directory is listed with _scan_files. For single-record files
+        the GeoID and timestamp come from the "{geoid}_{timestamp}.json"
+        filename, so no file is stat'ed or read; batch segments are listed
+        from their ".idx" sidecars.
+
+        The index is revalidated on every call: while the directory's mtime
+        is unchanged it is reused as is, otherwise the directory is listed
+        again and only files not seen before are indexed (a removed file
+        rebuilds it), so records saved by other processes are included.
+
+        Returns:
+            dict: GeoID -> list of (timestamp, path, offset) entries; offset
+                is None for single-record JSON files
+        """
+        mtime = os.stat(self.raw_dir).st_mtime_ns
+        if self._raw_index is not None and mtime == self._raw_mtime and not self._raw_racy:
+            return self._raw_index
+
+        scanned_at = time.time_ns()
+        files = {entry.name: Path(entry.path) for entry in _scan_files(self.raw_dir, (".json", ".ndjson"))}
+        if self._raw_index is None or not self._raw_names <= files.keys():
+            self._raw_index, self._raw_names = {}, set()
+
+        for name in files.keys() - self._raw_names:
+            self._index_raw_file(name, files[name])
+            self._raw_names.add(name)
+
+        # mtime has coarse granularity, so a file added just after listing
+        # can leave it unchanged; a listing that close to the last change
+        # is checked again next time
+        self._raw_mtime = mtime
+        self._raw_racy = scanned_at - mtime < 1_000_000_000
+        return self._raw_index
+
+    def _index_raw_file(self, name, path):
+        """Add one raw file's records to the raw index"""
+        if name.endswith(".ndjson"):
+            for geoid, timestamp, offset in self._read_segment_index(path):
+                self._raw_index.setdefault(geoid, []).append((timestamp, path, offset))
+            return
+
+        # GeoIDs are 8 characters ("G" + 7 digits), so the usual name needs
+        # only a slice; anything else is split
+        stem = name[:-len(".json")]
+        if name[8:9] == '_':
+            geoid, timestamp = stem[:8], stem[9:]
+        else:
+            geoid, _, timestamp = stem.partition('_')
+        self._raw_index.setdefault(geoid, []).append((timestamp, path, None))
+
+    @staticmethod
+    def _read_segment_index(path):
+        """
+        List the records of a raw batch segment
+
+        Reads the ".idx" sidecar; a segment without one (e.g. copied in
+        without it) is scanned line by line instead.
+
+        Returns:
+            list: (geoid, timestamp, offset) tuples
+        """
+        index_file = path.with_suffix(".idx")
+        if index_file.exists():
+            meta = _read_json(index_file)
+            return [(g, meta["timestamp"], o) for g, o in zip(meta["geoids"], meta["offsets"])]
+
+        # raw_batch_{timestamp}_{id}.ndjson
+        timestamp = path.stem[len("raw_batch_"):].rsplit('_', 1)[0]
+        records = []
+        position = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    records.append((json_loads(line).get('geoid'), timestamp, position))
+                except json.JSONDecodeError:
+                    print(f"Error reading {path} at byte {position}")
+                position += len(line)
+        return records
+
+    @staticmethod
+    def _read_raw_entry(entry):
+        """Load the record behind a raw_index entry"""
+        _, path, offset = entry
+        if offset is None:
+            return _decompress_text_fields(_read_json(path))
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return _decompress_text_fields(json_loads(f.readline()))
+
     def load_raw_data(self, geoid):
         """
         Load most recent raw data for a GeoID
@@ -96,36 +632,66 @@ class DataStorage:
         Returns:
             dict: Loaded data or None if not found
         """
-        # Find most recent file for this GeoID
-        pattern = f"{geoid}_*.json"
-        files = sorted(self.raw_dir.glob(pattern), reverse=True)
-
-        if not files:
+        # Find most recent record for this GeoID
+        entries = self.raw_index().get(geoid)
+        if not entries:
             return None
 
-        with open(files[0], 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self._read_raw_entry(max(entries, key=lambda entry: entry[0]))
 
-    def load_all_data(self):
+    def load_all_data(self, files=None):
         """
         Load all processed county data
 
+        Files unchanged since the previous call are not parsed again, so
+        polling this is cheap. Records are shared with that cache; copy
+        them before modifying.
+
+        Args:
+            files (list): JSON/Feather files to load (default: every
+                processed/*.json and *.feather from save_batch_data)
+
         Returns:
             list: List of all county data dictionaries
         """
         all_data = []
 
-        # Load from JSON files
-        for json_file in self.processed_dir.glob("*.json"):
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    all_data.extend(data)
-                else:
-                    all_data.append(data)
+        if files is None:
+            files = self.batch_files()
+
+        cache = {}
+        for path in map(Path, files):
+            stat = path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+
+            cached = self._batch_cache.get(path)
+            records = cached[1] if cached and cached[0] == signature else self._read_batch_file(path)
+
+            cache[path] = (signature, records)
+            all_data.extend(records)
 
+        self._batch_cache = cache
         return all_data
 
+    @staticmethod
+    def _read_batch_file(path):
+        """Parse one save_batch_data file into a list of records"""
+        if path.suffix == ".feather":
+            return _read_feather_records(path)
+
+        data = _read_json(path)
+        return data if isinstance(data, list) else [data]
+
+    def batch_files(self):
+        """
+        List the processed batch files written by save_batch_data
+
+        Returns:
+            list: Sorted paths of processed *.json and *.feather files
+        """
+        suffixes = (".json", ".feather") if HAS_PYARROW else (".json",)
+        return sorted(Path(entry.path) for entry in _scan_files(self.processed_dir, suffixes))
+
     def load_csv_data(self, filename="counties_data.csv"):
         """
         Load data from CSV file
@@ -138,7 +704,7 @@ class DataStorage:
         """
         filepath = self.processed_dir / filename
         if filepath.exists():
-            return pd.read_csv(filepath)
+            return self.load_table(filepath)
         return pd.DataFrame()
 
     def merge_and_deduplicate(self):
@@ -148,27 +714,32 @@ class DataStorage:
         Returns:
             pd.DataFrame: Merged and deduplicated data
         """
-        all_data = []
+        # One small read per GeoID is mostly I/O wait, so reads overlap in
+        # threads; map keeps the GeoIDs in index order
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as executor:
+            records = executor.map(self._load_newest_raw, self.raw_index().values())
+            all_data = [record for record in records if record is not None]
 
-        for json_file in self.raw_dir.glob("*.json"):
-            with open(json_file, 'r', encoding='utf-8') as f:
-                try:
-                    data = json.load(f)
-                    all_data.append(data)
-                except json.JSONDecodeError:
-                    print(f"Error reading {json_file}")
-                    continue
+        return pd.DataFrame(all_data)
 
-        if not all_data:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(all_data)
+    @classmethod
+    def _load_newest_raw(cls, entries):
+        """
+        Load the newest readable record of one GeoID's raw_index entries
 
-        # Remove duplicates based on GeoID, keeping most recent
-        if 'geoid' in df.columns:
-            df = df.sort_values('timestamp', ascending=False).drop_duplicates('geoid', keep='first')
+        Entries are ordered by their save timestamp, so only the newest is
+        parsed; older ones are fallbacks for unreadable records.
 
-        return df
+        Returns:
+            dict: The record, or None if none could be read
+        """
+        for entry in sorted(entries, key=lambda entry: entry[0], reverse=True):
+            try:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                return cls._read_raw_entry(entry)
+            except json.JSONDecodeError:
+                print(f"Error reading {entry[1]}")
+        return None
 
     def get_scraping_progress(self):
         """
@@ -177,17 +748,13 @@ class DataStorage:
         Returns:
             dict: Progress statistics
         """
-        raw_files = list(self.raw_dir.glob("*.json"))
-        unique_geoids = set()
-
-        for filepath in raw_files:
-            geoid = filepath.stem.split('_')[0]
-            unique_geoids.add(geoid)
+        index = self.raw_index()
 
         return {
-            "total_files": len(raw_files),
-            "unique_counties": len(unique_geoids),
-            "geoids_scraped": sorted(unique_geoids)
+            "total_files": len({path for entries in index.values() for _, path, _ in entries}),
+            "total_records": sum(len(entries) for entries in index.values()),
+            "unique_counties": len(index),
+            "geoids_scraped": sorted(index)
         }
 
 
@@ -0,0 +1,35 @@
+"""
+Event Loop Utility
+Run the scrapers' entry points on uvloop when it is available
+"""
+
+import asyncio
+import sys
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    # Optional: libuv-based event loop, cheaper dispatch for many concurrent tasks
+    HAS_UVLOOP = False
+
+
+def run_main(main):
+    """
+    Run a coroutine to completion, like asyncio.run
+
+    Args:
+        main (coroutine): Entry point coroutine
+
+    Returns:
+        The coroutine's return value
+    """
+    if not HAS_UVLOOP:
+        return asyncio.run(main)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(main)
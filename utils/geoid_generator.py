@@ -3,6 +3,7 @@ GeoID Generator Utility
 Generates and validates GeoID ranges for NREL SLOPE county data
 """
 
+
 class GeoIDGenerator:
     """Generate GeoID sequences for NREL SLOPE counties"""
 
@@ -58,67 +59,95 @@ class GeoIDGenerator:
         start_num = self.parse_geoid(self.start_id)
         end_num = self.parse_geoid(self.end_id)
 
-        current = start_num
-        while current <= end_num:
-            yield self.format_geoid(current)
-            current += step
+        for num in range(start_num, end_num + 1, step):
+            yield f"G{num:07d}"
+
+    def generate_unscraped(self, scraped, step=10):
+        """
+        Generate the GeoIDs in range that have not been scraped yet
+
+        Lets an interrupted scrape resume, e.g. with
+        ``generator.generate_unscraped(storage.raw_index())``.
+
+        Args:
+            scraped (iterable): GeoIDs already scraped (a raw_index dict works)
+            step (int): Increment step for GeoIDs
+
+        Yields:
+            str: GeoID string
+        """
+        # Hash membership per ID instead of scanning a list
+        scraped = frozenset(scraped)
+        for geoid in self.generate_range(step):
+            if geoid not in scraped:
+                yield geoid
 
-    def get_batch(self, batch_size, offset=0):
+    def get_batch(self, batch_size, offset=0, step=10):
         """
         Get a batch of GeoIDs
 
         Args:
             batch_size (int): Number of GeoIDs to return
             offset (int): Starting offset
+            step (int): Increment step for GeoIDs
 
         Returns:
             list: List of GeoID strings
         """
-        geoids = list(self.generate_range())
-        start_idx = offset
-        end_idx = min(offset + batch_size, len(geoids))
-        return geoids[start_idx:end_idx]
+        # Index straight into the range: the window's first GeoID, stopping
+        # at batch_size IDs or the end of the range
+        first = self.parse_geoid(self.start_id) + offset * step
+        stop = min(first + batch_size * step, self.parse_geoid(self.end_id) + 1)
+        return [f"G{num:07d}" for num in range(first, stop, step)]
 
-    def split_for_agents(self, num_agents):
+    def split_for_agents(self, num_agents, step=10):
         """
         Split GeoID range into chunks for multiple agents
 
+        Boundaries are computed on the step grid, so every chunk starts on
+        a real GeoID and chunk sizes differ by at most one.
+
         Args:
             num_agents (int): Number of agents to split work across
+            step (int): Increment step for GeoIDs
 
         Returns:
             list: List of (start_geoid, end_geoid) tuples for each agent
         """
         start_num = self.parse_geoid(self.start_id)
-        end_num = self.parse_geoid(self.end_id)
-
-        total_range = end_num - start_num
-        chunk_size = total_range // num_agents
+        chunk_size, remainder = divmod(self.count_total(step), num_agents)
 
         agent_ranges = []
+        offset = 0
         for i in range(num_agents):
-            chunk_start = start_num + (i * chunk_size)
-            if i == num_agents - 1:
-                # Last agent gets remainder
-                chunk_end = end_num
-            else:
-                chunk_end = chunk_start + chunk_size - 1
+            # The first `remainder` agents take one extra GeoID
+            count = chunk_size + (1 if i < remainder else 0)
+            chunk_start = start_num + offset * step
+            chunk_end = chunk_start + (count - 1) * step
 
             agent_ranges.append((
                 self.format_geoid(chunk_start),
                 self.format_geoid(chunk_end)
             ))
+            offset += count
 
         return agent_ranges
 
-    def count_total(self):
+    def count_total(self, step=10):
         """
         Count total number of GeoIDs in range
 
+        Args:
+            step (int): Increment step for GeoIDs
+
         Returns:
             int: Total count of GeoIDs
         """
-        return len(list(self.generate_range()))
+        start_num = self.parse_geoid(self.start_id)
+        end_num = self.parse_geoid(self.end_id)
+        if end_num < start_num:
+            return 0
+        return (end_num - start_num) // step + 1
 
 
 if __name__ == "__main__":
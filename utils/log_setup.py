@@ -0,0 +1,45 @@
+"""
+Logging Setup Utility
+Queue-backed logging so concurrent agents never block on file or console I/O
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def setup_logging(log_file="scrape.log", console=False, level=logging.INFO):
+    """
+    Route all log records through a queue to a background writer thread
+
+    Callers only enqueue records; formatting and writing happen on the
+    listener thread, so agents don't contend for stdout and tqdm progress
+    bars stay intact.
+
+    Args:
+        log_file (str): File the records are written to
+        console (bool): Also echo records to stderr
+        level (int): Minimum level recorded
+
+    Returns:
+        QueueListener: Running listener (stopped automatically at exit)
+    """
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    handlers = [logging.FileHandler(log_file, encoding='utf-8')]
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(records)]
+    root.setLevel(level)
+
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    return listener
@@ -0,0 +1,57 @@
+"""
+Rate Limiter Utility
+Async token bucket shared by concurrent scraper agents
+"""
+
+import asyncio
+
+
+class RateLimiter:
+    """Limit the aggregate request rate of many coroutines"""
+
+    def __init__(self, max_rate, time_period=1.0):
+        """
+        Initialize rate limiter
+
+        Args:
+            max_rate (float): Requests allowed per time period (also the burst size)
+            time_period (float): Length of the period in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+
+        self._tokens = float(max_rate)
+        self._last_refill = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now):
+        """
+        Add the tokens earned since the last refill
+
+        Args:
+            now (float): Current event loop time
+        """
+        if self._last_refill is not None:
+            earned = (now - self._last_refill) * self.max_rate / self.time_period
+            self._tokens = min(self.max_rate, self._tokens + earned)
+        self._last_refill = now
+
+    async def acquire(self):
+        """Wait until a request slot is available and take it"""
+        loop = asyncio.get_running_loop()
+
+        # Waiters queue on the lock, so slots are handed out in order
+        async with self._lock:
+            while True:
+                self._refill(loop.time())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False